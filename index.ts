@@ -3,133 +3,47 @@
  * Entry point for the application
  */
 
-import { scrapeCamden } from './src/scrapers/camden';
-import { scrapeColumns } from './src/scrapers/columns';
-import { scrapeDrift } from './src/scrapers/drift';
-import { DataProcessor } from './src/utils/dataProcessor';
+import { runPipeline } from './src/pipeline';
+import { closeBrowser } from './src/scrapers';
 import { ReportGenerator } from './src/utils/reportGenerator';
-import { FloorPlan, ScrapingResult } from './src/types/types';
 
 async function main(): Promise<void> {
   try {
     console.log('🏡 LeaseWatch - Starting apartment pricing tracker...');
-    console.log(`📅 Date: ${new Date().toISOString()}`);
-    
-    const allFloorPlans: FloorPlan[] = [];
-    const scrapingResults: ScrapingResult[] = [];
+    // Header and pipeline results share the run's timestamp
+    const timestamp = new Date().toISOString();
+    console.log(`📅 Date: ${timestamp}`);
     
     // Phase 1: Run scrapers and collect data
     console.log('\n🔍 Phase 1: Data Collection');
     console.log('=' .repeat(50));
     
-    try {
-      const camdenPlans = await scrapeCamden();
-      allFloorPlans.push(...camdenPlans);
-      scrapingResults.push({
-        success: true,
-        message: 'Camden scraping completed successfully',
-        timestamp: new Date().toISOString(),
-        source: 'Camden Dunwoody',
-        floorPlans: camdenPlans,
-        errors: []
-      });
-    } catch (error) {
-      console.error('❌ Camden scraping failed:', error);
-      scrapingResults.push({
-        success: false,
-        message: `Camden scraping failed: ${error instanceof Error ? error.message : 'Unknown error'}`,
-        timestamp: new Date().toISOString(),
-        source: 'Camden Dunwoody',
-        floorPlans: [],
-        errors: [error instanceof Error ? error.message : 'Unknown error']
-      });
-    }
-    
-    try {
-      const columnsPlans = await scrapeColumns();
-      allFloorPlans.push(...columnsPlans);
-      scrapingResults.push({
-        success: true,
-        message: 'Columns scraping completed successfully',
-        timestamp: new Date().toISOString(),
-        source: 'The Columns at Lake Ridge',
-        floorPlans: columnsPlans,
-        errors: []
-      });
-    } catch (error) {
-      console.error('❌ Columns scraping failed:', error);
-      scrapingResults.push({
-        success: false,
-        message: `Columns scraping failed: ${error instanceof Error ? error.message : 'Unknown error'}`,
-        timestamp: new Date().toISOString(),
-        source: 'The Columns at Lake Ridge',
-        floorPlans: [],
-        errors: [error instanceof Error ? error.message : 'Unknown error']
-      });
-    }
-    
-    try {
-      const driftPlans = await scrapeDrift();
-      allFloorPlans.push(...driftPlans);
-      scrapingResults.push({
-        success: true,
-        message: 'Drift scraping completed successfully',
-        timestamp: new Date().toISOString(),
-        source: 'Drift Dunwoody',
-        floorPlans: driftPlans,
-        errors: []
-      });
-    } catch (error) {
-      console.error('❌ Drift scraping failed:', error);
-      scrapingResults.push({
-        success: false,
-        message: `Drift scraping failed: ${error instanceof Error ? error.message : 'Unknown error'}`,
-        timestamp: new Date().toISOString(),
-        source: 'Drift Dunwoody',
-        floorPlans: [],
-        errors: [error instanceof Error ? error.message : 'Unknown error']
-      });
-    }
+    // Scraping is finished once the pipeline returns, so release the shared browser
+    const { scrapingResults, allFloorPlans, propertySummaries, dailyReport } =
+      await runPipeline({ timestamp }).finally(closeBrowser);
     
     // Phase 2: Process and analyze data
     console.log('\n📊 Phase 2: Data Analysis');
     console.log('=' .repeat(50));
     
-    if (allFloorPlans.length === 0) {
+    if (!dailyReport) {
       console.log('❌ No floor plans found. Check scraping results.');
       return;
     }
     
-    // Create property summaries
-    const propertySummaries = [];
-    const camdenPlans = allFloorPlans.filter(fp => fp.propertyName === 'Camden Dunwoody');
-    const columnsPlans = allFloorPlans.filter(fp => fp.propertyName === 'The Columns at Lake Ridge');
-    
-    if (camdenPlans.length > 0) {
-      propertySummaries.push(DataProcessor.createPropertySummary('Camden Dunwoody', camdenPlans));
-    }
-    
-    if (columnsPlans.length > 0) {
-      propertySummaries.push(DataProcessor.createPropertySummary('The Columns at Lake Ridge', columnsPlans));
-    }
-    
-    // Create daily report
-    const dailyReport = DataProcessor.createDailyReport(propertySummaries, allFloorPlans);
-    
     // Phase 3: Generate reports
     console.log('\n📋 Phase 3: Report Generation');
     console.log('=' .repeat(50));
     
-    // Generate and display comprehensive report
-    const report = ReportGenerator.generateDailyReport(dailyReport);
-    console.log(report);
-    
-    // Generate comparison report if multiple properties
+    // Generate comprehensive report, plus a comparison if multiple properties
+    const reports = [ReportGenerator.generateDailyReport(dailyReport)];
     if (propertySummaries.length > 1) {
-      const comparison = ReportGenerator.generateComparisonReport(propertySummaries);
-      console.log(comparison);
+      reports.push(ReportGenerator.generateComparisonReport(propertySummaries));
     }
     
+    // Emit all reports in a single write
+    console.log(reports.join('\n'));
+    
     // Summary statistics
     console.log('\n✅ SCRAPING SUMMARY');
     console.log('=' .repeat(50));
@@ -0,0 +1,56 @@
+/**
+ * LeaseWatch Pipeline
+ * Runs the scrapers and builds the daily report data without any console output,
+ * so both the CLI and the HTTP server can share it
+ */
+
+import { scrapeCamden, scrapeColumns, scrapeDrift, scrapeProperty, Scraper } from './scrapers';
+import { DataProcessor } from './utils/dataProcessor';
+import { DailyReport, PipelineResult, PropertySummary } from './types/types';
+
+const SCRAPERS: Array<[Scraper, string]> = [
+  [scrapeCamden, 'Camden Dunwoody'],
+  [scrapeColumns, 'The Columns at Lake Ridge'],
+  [scrapeDrift, 'Drift Dunwoody']
+];
+
+// Properties that get a summary and appear in the comparison report. Drift's
+// square footage is estimated rather than listed, so its plans are only
+// counted in the market-wide figures
+const SUMMARIZED_PROPERTIES = ['Camden Dunwoody', 'The Columns at Lake Ridge'];
+
+export interface PipelineOptions {
+  // Build property summaries and the daily report; callers that only need scrape counts can skip it
+  includeReport?: boolean;
+  // Run timestamp shared by every result; defaults to the time the pipeline starts
+  timestamp?: string;
+}
+
+export async function runPipeline(options: PipelineOptions = {}): Promise<PipelineResult> {
+  // One timestamp for the whole run, shared by every result
+  const { includeReport = true, timestamp = new Date().toISOString() } = options;
+  
+  // Scrapers are independent network-bound jobs, so run them concurrently
+  const scrapingResults = await Promise.all(
+    SCRAPERS.map(([scraper, source]) => scrapeProperty(scraper, source, timestamp))
+  );
+  const allFloorPlans = scrapingResults.flatMap(result => result.floorPlans);
+  
+  let propertySummaries: PropertySummary[] = [];
+  let dailyReport: DailyReport | null = null;
+  
+  if (includeReport && allFloorPlans.length > 0) {
+    // Summarize the tracked properties in one grouped pass over the plans
+    propertySummaries = DataProcessor.createPropertySummaries(allFloorPlans, SUMMARIZED_PROPERTIES);
+    
+    dailyReport = DataProcessor.createDailyReport(propertySummaries, allFloorPlans, timestamp);
+  }
+  
+  return {
+    timestamp,
+    scrapingResults,
+    allFloorPlans,
+    propertySummaries,
+    dailyReport
+  };
+}
@@ -0,0 +1,121 @@
+/**
+ * Shared Browser
+ * Launches a single headless Chromium on first use and shares it between the
+ * property scrapers, which each work in their own browser context
+ */
+
+import type { Browser, BrowserContext, BrowserContextOptions, Page } from 'playwright';
+
+let browserPromise: Promise<Browser> | null = null;
+
+/**
+ * Get the shared browser, launching it if needed. Concurrent callers share
+ * the same launch, and a crashed or failed browser is relaunched on next use.
+ * Playwright itself is only loaded here, on the first launch, so importing the
+ * scrapers (e.g. when the server starts) doesn't pay for its module graph
+ */
+export function getBrowser(): Promise<Browser> {
+  if (!browserPromise) {
+    console.log('🚀 Launching shared browser...');
+    const launch: Promise<Browser> = import('playwright').then(({ chromium }) => chromium.launch({
+      headless: true, // Run in headless mode
+      args: ['--disable-dev-shm-usage']
+    })).then(browser => {
+      browser.on('disconnected', () => {
+        if (browserPromise === launch) browserPromise = null;
+      });
+      return browser;
+    });
+    launch.catch(() => {
+      if (browserPromise === launch) browserPromise = null;
+    });
+    browserPromise = launch;
+  }
+
+  return browserPromise;
+}
+
+/**
+ * Close the shared browser if one was launched
+ */
+export async function closeBrowser(): Promise<void> {
+  const pending = browserPromise;
+  browserPromise = null;
+  if (!pending) return;
+
+  const browser = await pending.catch(() => null);
+  if (browser) {
+    await browser.close();
+    console.log('🔒 Shared browser closed');
+  }
+}
+
+/**
+ * Whether an error is Playwright's TimeoutError. Checked by name so callers
+ * don't have to load Playwright just to compare against its error class
+ */
+export function isTimeoutError(error: unknown): error is Error {
+  return error instanceof Error && error.name === 'TimeoutError';
+}
+
+/**
+ * Options every scraper context starts from. The user agent is applied when the
+ * context is created, so the first navigation already sends it, and service
+ * workers are blocked so they cannot register and add requests of their own
+ */
+export const SCRAPER_CONTEXT_OPTIONS: BrowserContextOptions = {
+  userAgent: 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+  viewport: { width: 1280, height: 800 },
+  serviceWorkers: 'block'
+};
+
+// Resource types and third-party hosts the scrapers never read from
+const BLOCKED_RESOURCE_TYPES = new Set(['image', 'media', 'font', 'stylesheet']);
+const BLOCKED_HOSTS = [
+  'google-analytics.com',
+  'googletagmanager.com',
+  'doubleclick.net',
+  'facebook.com',
+  'facebook.net',
+  'hotjar.com',
+  'segment.com',
+  'segment.io',
+];
+
+/** Whether a request URL's hostname is a blocked host or one of its subdomains */
+function isBlockedHost(url: string): boolean {
+  let hostname: string;
+  try {
+    hostname = new URL(url).hostname;
+  } catch {
+    return false;
+  }
+  return BLOCKED_HOSTS.some(host => hostname === host || hostname.endsWith('.' + host));
+}
+
+/**
+ * Abort requests for assets and trackers in a context. Extraction only reads
+ * DOM structure and text, so none of these affect the scraped data
+ */
+export async function blockUnneededRequests(context: BrowserContext): Promise<void> {
+  await context.route('**/*', route => {
+    const request = route.request();
+    if (BLOCKED_RESOURCE_TYPES.has(request.resourceType()) || isBlockedHost(request.url())) {
+      return route.abort();
+    }
+    return route.continue();
+  });
+}
+
+/**
+ * Wait until any of the selectors matches an element in the page. The check
+ * runs in the page on every animation frame, so it resolves as soon as content
+ * attaches rather than on waitForSelector's backoff retry schedule
+ */
+export async function waitForAnySelector(page: Page, selectors: string[], timeout: number): Promise<void> {
+  await page.waitForFunction(
+    (sels: string[]) => sels.some(sel => document.querySelector(sel) !== null),
+    selectors,
+    { timeout, polling: 'raf' }
+  );
+}
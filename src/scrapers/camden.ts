@@ -3,39 +3,123 @@
  * Handles scraping apartment data from Camden Living website
  */
 
-import { chromium } from 'playwright';
+import * as https from 'https';
+import type { Browser, BrowserContext } from 'playwright';
 import { FloorPlan } from '../types/types';
 import { DataProcessor } from '../utils/dataProcessor';
+import { FileCache } from '../utils/cache';
+import { blockUnneededRequests, getBrowser, isTimeoutError, SCRAPER_CONTEXT_OPTIONS } from './browser';
+
+const CAMDEN_URL = 'https://www.camdenliving.com/apartments/dunwoody-ga/camden-dunwoody/available-apartments';
+const COMMUNITY_AMENITIES_KEY = 'camden-dunwoody-community-amenities';
+const COMMUNITY_AMENITIES_TTL_MS = 7 * 24 * 60 * 60 * 1000; // One week
+
+const amenitiesCache = new FileCache();
+
+const CAMDEN_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36';
+const MAX_STATIC_REDIRECTS = 3;
+
+/**
+ * Fetch the listings page over plain HTTP, following redirects. Resolves with
+ * the HTML only when the floor plan cards are already server-rendered into it,
+ * otherwise logs why and resolves with null
+ */
+function fetchStaticListing(url: string, redirectsLeft: number = MAX_STATIC_REDIRECTS): Promise<string | null> {
+  const fallBack = (reason: string): null => {
+    console.log(`⚠️ Static Camden listing unusable (${reason}), loading the full page...`);
+    return null;
+  };
+  
+  return new Promise(resolve => {
+    const req = https.get(url, {
+      headers: { 'User-Agent': CAMDEN_USER_AGENT, 'Accept': 'text/html' },
+      timeout: 10000
+    }, res => {
+      const status = res.statusCode ?? 0;
+      const location = res.headers.location;
+      if (status >= 300 && status < 400 && location) {
+        res.resume();
+        resolve(redirectsLeft > 0
+          ? fetchStaticListing(new URL(location, url).toString(), redirectsLeft - 1)
+          : fallBack('too many redirects'));
+        return;
+      }
+      if (status !== 200) {
+        res.resume();
+        resolve(fallBack(`HTTP ${status}`));
+        return;
+      }
+      
+      let html = '';
+      res.setEncoding('utf8');
+      res.on('data', chunk => { html += chunk; });
+      res.on('end', () => resolve(html.includes('floorplan-card') ? html : fallBack('no server-rendered floor plans')));
+      res.on('error', error => resolve(fallBack(error.message)));
+    });
+    req.on('timeout', () => req.destroy(new Error('timed out')));
+    req.on('error', error => resolve(fallBack(error.message)));
+  });
+}
 
 export async function scrapeCamden(): Promise<FloorPlan[]> {
   console.log('🏢 Scraping Camden...');
   
-  let browser;
+  let context: BrowserContext | undefined;
   
   try {
-    // Launch browser
-    console.log('🚀 Launching Camden browser...');
-    browser = await chromium.launch({
-      headless: true // Run in headless mode
-    });
+    // Request the raw HTML while the browser starts up
+    const staticListing = fetchStaticListing(CAMDEN_URL);
+    
+    // Reuse the shared browser; this scraper only owns its context
+    console.log('🚀 Opening Camden browser context...');
+    const browser = await getBrowser();
     
-    const page = await browser.newPage();
+    // Community amenities load from their own page, so start them now and let
+    // them run alongside the listing load and card extraction below
+    const communityAmenities = loadCommunityAmenities(browser);
+    const staticHtml = await staticListing;
+    
+    if (staticHtml) {
+      // The cards are in the server-rendered markup, so load it with scripts disabled
+      // instead of running the full single-page app and fetching its assets
+      console.log('⚡ Floor plans found in server-rendered HTML, skipping page scripts...');
+      context = await browser.newContext({
+        ...SCRAPER_CONTEXT_OPTIONS,
+        javaScriptEnabled: false,
+        userAgent: CAMDEN_USER_AGENT
+      });
+      await blockUnneededRequests(context);
+      const page = await context.newPage();
+      await page.setContent(staticHtml, { waitUntil: 'domcontentloaded' });
+      
+      // Extract floor plan data
+      console.log('🔍 Extracting floor plan data...');
+      const floorPlans = await extractCamdenFloorPlans(page, communityAmenities);
+      console.log(`📊 Found ${floorPlans.length} floor plans`);
+      
+      // An empty result may mean the markup changed; retry with the full page below
+      if (floorPlans.length > 0) {
+        return floorPlans;
+      }
+      await context.close();
+    }
     
     // Set user agent to avoid detection
-    await page.setExtraHTTPHeaders({
-      'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    });
+    context = await browser.newContext({ ...SCRAPER_CONTEXT_OPTIONS, userAgent: CAMDEN_USER_AGENT });
+    await blockUnneededRequests(context);
+    const page = await context.newPage();
     
     console.log('📍 Navigating to Camden Dunwoody website...');
     
     // Navigate to Camden Dunwoody apartments page
-    await page.goto('https://www.camdenliving.com/apartments/dunwoody-ga/camden-dunwoody/available-apartments', {
-      waitUntil: 'domcontentloaded',
-      timeout: 15000
+    await page.goto(CAMDEN_URL, {
+      waitUntil: 'commit',
+      timeout: 10000
     });
     
-    // Wait a bit for dynamic content to load
-    await page.waitForTimeout(3000);
+    // Gate on the floor plan cards we actually read rather than on DOMContentLoaded,
+    // which a script-heavy page can hold back long after the cards are rendered
+    await page.waitForSelector('.floorplan-card, [class*="floorplan-card"]', { timeout: 15000 });
     
     // Get and log the page title
     const title = await page.title();
@@ -47,7 +131,7 @@ export async function scrapeCamden(): Promise<FloorPlan[]> {
     
     // Extract floor plan data
     console.log('🔍 Extracting floor plan data...');
-    const floorPlans = await extractCamdenFloorPlans(page);
+    const floorPlans = await extractCamdenFloorPlans(page, communityAmenities);
     
     // Log the extracted data
     console.log(`📊 Found ${floorPlans.length} floor plans`);
@@ -55,296 +139,425 @@ export async function scrapeCamden(): Promise<FloorPlan[]> {
     return floorPlans;
     
   } catch (error) {
+    // A timeout means the site was slow or its markup changed, so report no data.
+    // Anything else is rethrown so the run records this source as failed
+    if (isTimeoutError(error)) {
+      console.error('❌ Timed out scraping Camden:', error.message);
+      return [];
+    }
     console.error('❌ Error scraping Camden:', error instanceof Error ? error.message : 'Unknown error');
-    return [];
+    throw error;
   } finally {
-    if (browser) {
-      await browser.close();
-      console.log('🔒 Camden browser closed');
+    if (context) {
+      await context.close();
+      console.log('🔒 Camden browser context closed');
     }
   }
 }
 
-async function extractCamdenFloorPlans(page: any): Promise<FloorPlan[]> {
-  try {
-    // Wait for floor plan cards to load - using the actual Camden class names
-    await page.waitForSelector('.floorplan-card, [class*="floorplan-card"]', { timeout: 10000 });
+// Raw card fields as read in the page, before DataProcessor parsing
+interface RawCamdenFloorPlan {
+  name: string;
+  price: string;
+  bedBathCount: string;
+  squareFootage: string;
+  amenities: string[];
+  availability: string;
+}
+
+/**
+ * Runs in the page: read the community amenities listed in the amenities section
+ */
+function readCommunityAmenitiesInPage(): string[] {
+  const amenitiesSection = document.querySelector('#amenities, [id*="amenities"]');
+  const amenities = new Set<string>(); // Deduplicated before crossing back to Node
+  
+  if (amenitiesSection) {
+    // Look for amenity lists in the amenities section with a single element walk
+    const amenityQuery = 'li, .amenity, [class*="amenity"], .feature, [class*="feature"]';
+    const walker = document.createTreeWalker(amenitiesSection, NodeFilter.SHOW_ELEMENT, {
+      acceptNode: (node: any) => node.matches(amenityQuery) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP
+    });
+    for (let el: any = walker.nextNode(); el; el = walker.nextNode()) {
+      // Most amenity items hold a single text node; skip the textContent recursion for those
+      const only = el.firstChild;
+      const text = only && only === el.lastChild && only.nodeType === Node.TEXT_NODE
+        ? (only.nodeValue || '').trim()
+        : el.textContent?.trim();
+      if (text && text.length > 2 && text.length < 100 && !text.includes('Amenities')) {
+        amenities.add(text);
+      }
+    }
+  }
+  
+  return [...amenities];
+}
+
+/**
+ * Runs in the page: read the raw fields of every floor plan card. The result is
+ * returned as one JSON string, which crosses back to Node as a single value
+ * instead of going through Playwright's per-property serialization
+ */
+function extractCardsInPage(): string {
+  // Get all floor plan cards using the actual Camden class structure. The exact
+  // class is looked up directly; the substring match is only a fallback, since it
+  // also picks up card sub-elements such as "floorplan-card-*" wrappers
+  const exactCards = document.getElementsByClassName('floorplan-card');
+  const floorPlanCards = exactCards.length > 0
+    ? Array.from(exactCards)
+    : Array.from(document.querySelectorAll('[class*="floorplan-card"]'));
+  
+  // Field selectors in priority order, queried once per card as a single union
+  const priceSelectors = [
+    '[class*="price"]',
+    '[class*="rent"]', 
+    '[class*="cost"]'
+  ];
+  const bedBathSelectors = [
+    '[class*="bed"]',
+    '[class*="bath"]',
+    '[class*="bedroom"]',
+    '[class*="bathroom"]'
+  ];
+  const sqftSelectors = [
+    'span.flex:has(img[alt="Floorplan"])',
+    'span.flex',
+    '[class*="sqft"]',
+    '[class*="square"]'
+  ];
+  const availabilitySelectors = [
+    'p[class*="jsx-"]', // Look for paragraph elements with jsx classes
+    'p',
+    '[class*="availability"]',
+    '[class*="date"]'
+  ];
+  const fieldSelectors = [...priceSelectors, ...bedBathSelectors, ...sqftSelectors, ...availabilitySelectors];
+  const fieldQuery = fieldSelectors.join(', ');
+  
+  // Unit amenity selectors, matched during one walk of each card
+  const amenitySelectors = [
+    '[class*="amenity"]',
+    '[class*="feature"]',
+    '[class*="highlight"]',
+    'ul li',
+    '.amenity-list li',
+    '.feature-list li'
+  ];
+  const amenityQuery = amenitySelectors.join(', ');
+  
+  // Trimmed text of an element, reading a lone text child directly instead of
+  // recursing through textContent
+  const readText = (el: any): string => {
+    const only = el.firstChild;
+    if (only && only === el.lastChild && only.nodeType === Node.TEXT_NODE) {
+      return (only.nodeValue || '').trim();
+    }
+    return (el.textContent || '').trim();
+  };
+  
+  const plans: RawCamdenFloorPlan[] = floorPlanCards.map((card: any) => {
+    // Walk the card once and record the first element matching each selector,
+    // which is what card.querySelector(selector) would return for it
+    const firstMatch = new Map<string, any>();
+    for (const el of card.querySelectorAll(fieldQuery)) {
+      for (const selector of fieldSelectors) {
+        if (!firstMatch.has(selector) && el.matches(selector)) {
+          firstMatch.set(selector, el);
+        }
+      }
+      if (firstMatch.size === fieldSelectors.length) break;
+    }
     
-    // First, try to navigate to amenities section to get community amenities
-    let communityAmenities: string[] = [];
-    try {
-      const amenitiesLink = await page.$('#community-navigation-amenities-camden-dunwoody, a[href="#amenities"]');
-      if (amenitiesLink) {
-        console.log('📍 Found amenities navigation, clicking to load amenities section...');
-        await amenitiesLink.click();
-        await page.waitForTimeout(2000); // Wait for amenities to load
-        
-        // Extract community amenities
-        communityAmenities = await page.evaluate(() => {
-          const amenitiesSection = document.querySelector('#amenities, [id*="amenities"]');
-          const amenities: string[] = [];
-          
-          if (amenitiesSection) {
-            // Look for amenity lists in the amenities section
-            const amenityElements = amenitiesSection.querySelectorAll('li, .amenity, [class*="amenity"], .feature, [class*="feature"]');
-            amenityElements.forEach((el: any) => {
-              const text = el.textContent?.trim();
-              if (text && text.length > 2 && text.length < 100 && !text.includes('Amenities')) {
-                amenities.push(text);
-              }
-            });
-          }
-          
-          return amenities;
-        });
-        
-        console.log(`🏢 Found ${communityAmenities.length} community amenities`);
+    // Full card text is only needed by the regex fallbacks, so read it at most once
+    let cardText: string | null = null;
+    const getCardText = (): string => {
+      if (cardText === null) cardText = card.textContent || '';
+      return cardText as string;
+    };
+    
+    // Extract floor plan name from h1 with specific classes
+    let name = '';
+    const nameEl = card.querySelector('h1.my-4.font-sans.font-extrabold, h1[class*="font-extrabold"], h1[class*="my-4"]');
+    if (nameEl && nameEl.textContent?.trim()) {
+      name = nameEl.textContent.trim();
+    }
+    
+    // Fallback: try other heading selectors
+    if (!name) {
+      const headingEl = card.querySelector('h1, h2, h3, .plan-name, [class*="plan-name"]');
+      if (headingEl && headingEl.textContent?.trim()) {
+        name = headingEl.textContent.trim();
       }
-    } catch (error) {
-      console.log('⚠️ Could not navigate to amenities section, will extract from floor plan cards only');
     }
     
-    const rawFloorPlans = await page.evaluate((communityAmenities: string[]) => {
-      // Get all floor plan cards using the actual Camden class structure
-      const floorPlanCards = Array.from(document.querySelectorAll('.floorplan-card, [class*="floorplan-card"]'));
-      
-      return floorPlanCards.map((card: any) => {
-        // Extract floor plan name from h1 with specific classes
-        let name = '';
-        const nameEl = card.querySelector('h1.my-4.font-sans.font-extrabold, h1[class*="font-extrabold"], h1[class*="my-4"]');
-        if (nameEl && nameEl.textContent?.trim()) {
-          name = nameEl.textContent.trim();
-        }
-        
-        // Fallback: try other heading selectors
-        if (!name) {
-          const headingEl = card.querySelector('h1, h2, h3, .plan-name, [class*="plan-name"]');
-          if (headingEl && headingEl.textContent?.trim()) {
-            name = headingEl.textContent.trim();
-          }
-        }
-        
-        // Extract price - look for dollar signs
-        let price = '';
-        const priceSelectors = [
-          '[class*="price"]',
-          '[class*="rent"]', 
-          '[class*="cost"]'
-        ];
-        
-        for (const selector of priceSelectors) {
-          const priceEl = card.querySelector(selector);
-          if (priceEl && priceEl.textContent?.includes('$')) {
-            price = priceEl.textContent.trim();
-            break;
-          }
-        }
-        
-        // If no price found in specific elements, search all text for $ pattern
-        if (!price) {
-          const allText = card.textContent || '';
-          const priceMatch = allText.match(/\$[\d,]+[+]?/);
-          if (priceMatch) {
-            price = priceMatch[0];
-          }
-        }
-        
-        // Extract bed/bath count from the specific container with icons
-        let bedBathCount = '';
-        let squareFootage = '';
-        
-        // Look for the container with bed, bath, and sqft info
-        const infoContainer = card.querySelector('.flex.flex-row.items-center.justify-between.w-full.font-bold, [class*="jsx-"][class*="flex"][class*="flex-row"]');
-        
-        if (infoContainer) {
-          // Extract bed count
-          const bedSpan = infoContainer.querySelector('span img[alt="Bed"], span img[src*="bed.svg"]');
-          if (bedSpan && bedSpan.parentElement) {
-            const bedText = bedSpan.parentElement.textContent?.trim();
-            if (bedText) {
-              const bedMatch = bedText.match(/(\d+)\s*Bed/i);
-              if (bedMatch) {
-                const bedCount = bedMatch[1];
-                
-                // Extract bath count
-                const bathSpan = infoContainer.querySelector('span img[alt="Bath"], span img[src*="bath.svg"]');
-                if (bathSpan && bathSpan.parentElement) {
-                  const bathText = bathSpan.parentElement.textContent?.trim();
-                  if (bathText) {
-                    const bathMatch = bathText.match(/(\d+)\s*Bath/i);
-                    if (bathMatch) {
-                      const bathCount = bathMatch[1];
-                      bedBathCount = `${bedCount} Bed / ${bathCount} Bath`;
-                    }
-                  }
+    // Extract price - look for dollar signs
+    let price = '';
+    for (const selector of priceSelectors) {
+      const priceEl = firstMatch.get(selector);
+      if (priceEl && priceEl.textContent?.includes('$')) {
+        price = priceEl.textContent.trim();
+        break;
+      }
+    }
+    
+    // If no price found in specific elements, search all text for $ pattern
+    if (!price) {
+      const allText = getCardText();
+      const priceMatch = allText.match(/\$[\d,]+[+]?/);
+      if (priceMatch) {
+        price = priceMatch[0];
+      }
+    }
+    
+    // Extract bed/bath count from the specific container with icons
+    let bedBathCount = '';
+    let squareFootage = '';
+    
+    // Look for the container with bed, bath, and sqft info
+    const infoContainer = card.querySelector('.flex.flex-row.items-center.justify-between.w-full.font-bold, [class*="jsx-"][class*="flex"][class*="flex-row"]');
+    
+    if (infoContainer) {
+      // Extract bed count
+      const bedSpan = infoContainer.querySelector('span img[alt="Bed"], span img[src*="bed.svg"]');
+      if (bedSpan && bedSpan.parentElement) {
+        const bedText = bedSpan.parentElement.textContent?.trim();
+        if (bedText) {
+          const bedMatch = bedText.match(/(\d+)\s*Bed/i);
+          if (bedMatch) {
+            const bedCount = bedMatch[1];
+            
+            // Extract bath count
+            const bathSpan = infoContainer.querySelector('span img[alt="Bath"], span img[src*="bath.svg"]');
+            if (bathSpan && bathSpan.parentElement) {
+              const bathText = bathSpan.parentElement.textContent?.trim();
+              if (bathText) {
+                const bathMatch = bathText.match(/(\d+)\s*Bath/i);
+                if (bathMatch) {
+                  const bathCount = bathMatch[1];
+                  bedBathCount = `${bedCount} Bed / ${bathCount} Bath`;
                 }
               }
             }
           }
-          
-          // Extract square footage from the same container
-          const sqftSpan = infoContainer.querySelector('span img[alt="Floorplan"], span img[src*="floorplan.svg"]');
-          if (sqftSpan && sqftSpan.parentElement) {
-            const sqftText = sqftSpan.parentElement.textContent?.trim();
-            if (sqftText && sqftText.includes('SqFt')) {
-              squareFootage = sqftText;
-            }
-          }
         }
-        
-        // Fallback: Extract bed/bath count using previous methods if not found
-        if (!bedBathCount) {
-          const bedBathSelectors = [
-            '[class*="bed"]',
-            '[class*="bath"]',
-            '[class*="bedroom"]',
-            '[class*="bathroom"]'
-          ];
-          
-          for (const selector of bedBathSelectors) {
-            const bedBathEl = card.querySelector(selector);
-            if (bedBathEl && (bedBathEl.textContent?.includes('bed') || bedBathEl.textContent?.includes('bath'))) {
-              bedBathCount = bedBathEl.textContent.trim();
-              break;
-            }
-          }
-        }
-        
-        // Fallback: search for bed/bath pattern in all text
-        if (!bedBathCount) {
-          const allText = card.textContent || '';
-          const bedBathMatch = allText.match(/(\d+)\s*bed[s]?\s*[\/\|,\s]+(\d+)\s*bath[s]?/i) || 
-                               allText.match(/(\d+)\s*br?\s*[\/\|,\s]+(\d+)\s*ba?/i) ||
-                               allText.match(/(\d+)\s*bedroom[s]?\s*[\/\|,\s]+(\d+)\s*bathroom[s]?/i);
-          if (bedBathMatch) {
-            bedBathCount = `${bedBathMatch[1]} Bed / ${bedBathMatch[2]} Bath`;
-          }
-        }
-        
-        // Fallback: Extract square footage if not found in the info container
-        if (!squareFootage) {
-          const sqftSelectors = [
-            'span.flex:has(img[alt="Floorplan"])',
-            'span.flex',
-            '[class*="sqft"]',
-            '[class*="square"]'
-          ];
-          
-          for (const selector of sqftSelectors) {
-            const sqftEl = card.querySelector(selector);
-            if (sqftEl && sqftEl.textContent?.includes('SqFt')) {
-              squareFootage = sqftEl.textContent.trim();
-              break;
-            }
-          }
+      }
+      
+      // Extract square footage from the same container
+      const sqftSpan = infoContainer.querySelector('span img[alt="Floorplan"], span img[src*="floorplan.svg"]');
+      if (sqftSpan && sqftSpan.parentElement) {
+        const sqftText = sqftSpan.parentElement.textContent?.trim();
+        if (sqftText && sqftText.includes('SqFt')) {
+          squareFootage = sqftText;
         }
-        
-        // Final fallback: search for SqFt pattern in all text
-        if (!squareFootage) {
-          const allText = card.textContent || '';
-          const sqftMatch = allText.match(/(\d+[,\d]*)\s*SqFt/i) || 
-                           allText.match(/(\d+[,\d]*)\s*sq\.?\s*ft\.?/i) ||
-                           allText.match(/(\d+[,\d]*)\s*square\s*feet/i);
-          if (sqftMatch) {
-            squareFootage = sqftMatch[0];
-          }
+      }
+    }
+    
+    // Fallback: Extract bed/bath count using previous methods if not found
+    if (!bedBathCount) {
+      for (const selector of bedBathSelectors) {
+        const bedBathEl = firstMatch.get(selector);
+        if (bedBathEl && (bedBathEl.textContent?.includes('bed') || bedBathEl.textContent?.includes('bath'))) {
+          bedBathCount = bedBathEl.textContent.trim();
+          break;
         }
-        
-        // Extract amenities - combine unit-specific and community amenities
-        const amenities: string[] = [...communityAmenities]; // Start with community amenities
-        const amenitySelectors = [
-          '[class*="amenity"]',
-          '[class*="feature"]',
-          '[class*="highlight"]',
-          'ul li',
-          '.amenity-list li',
-          '.feature-list li'
-        ];
-        
-        for (const selector of amenitySelectors) {
-          const amenityElements = card.querySelectorAll(selector);
-          amenityElements.forEach((el: any) => {
-            const text = el.textContent?.trim();
-            if (text && text.length > 0 && text.length < 100 && !amenities.includes(text)) { // Avoid duplicates
-              amenities.push(text);
-            }
-          });
+      }
+    }
+    
+    // Fallback: search for bed/bath pattern in all text
+    if (!bedBathCount) {
+      const allText = getCardText();
+      const bedBathMatch = allText.match(/(\d+)\s*bed[s]?\s*[\/\|,\s]+(\d+)\s*bath[s]?/i) || 
+                           allText.match(/(\d+)\s*br?\s*[\/\|,\s]+(\d+)\s*ba?/i) ||
+                           allText.match(/(\d+)\s*bedroom[s]?\s*[\/\|,\s]+(\d+)\s*bathroom[s]?/i);
+      if (bedBathMatch) {
+        bedBathCount = `${bedBathMatch[1]} Bed / ${bedBathMatch[2]} Bath`;
+      }
+    }
+    
+    // Fallback: Extract square footage if not found in the info container
+    if (!squareFootage) {
+      for (const selector of sqftSelectors) {
+        const sqftEl = firstMatch.get(selector);
+        if (sqftEl && sqftEl.textContent?.includes('SqFt')) {
+          squareFootage = sqftEl.textContent.trim();
+          break;
         }
-        
-        // Extract availability date
-        let availability = '';
-        const availabilitySelectors = [
-          'p[class*="jsx-"]', // Look for paragraph elements with jsx classes
-          'p',
-          '[class*="availability"]',
-          '[class*="date"]'
-        ];
-        
-        for (const selector of availabilitySelectors) {
-          const availabilityEl = card.querySelector(selector);
-          if (availabilityEl && availabilityEl.textContent?.trim()) {
-            const text = availabilityEl.textContent.trim();
-            // Check if text looks like a date (MM/DD/YYYY format)
-            if (text.match(/^\d{1,2}\/\d{1,2}\/\d{4}$/)) {
-              availability = text;
-              break;
-            }
-          }
+      }
+    }
+    
+    // Final fallback: search for SqFt pattern in all text
+    if (!squareFootage) {
+      const allText = getCardText();
+      const sqftMatch = allText.match(/(\d+[,\d]*)\s*SqFt/i) || 
+                       allText.match(/(\d+[,\d]*)\s*sq\.?\s*ft\.?/i) ||
+                       allText.match(/(\d+[,\d]*)\s*square\s*feet/i);
+      if (sqftMatch) {
+        squareFootage = sqftMatch[0];
+      }
+    }
+    
+    // Extract unit amenities; community amenities are merged in after extraction
+    const amenities = new Set<string>(); // Deduplicated as items are added
+    
+    // Walk the card once, reading each matching node's text a single time and
+    // bucketing it under every selector it matches to keep the per-selector order
+    const amenityBuckets = amenitySelectors.map(selector => ({ selector, texts: [] as string[] }));
+    const walker = document.createTreeWalker(card, NodeFilter.SHOW_ELEMENT, {
+      acceptNode: (node: any) => node.matches(amenityQuery) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_SKIP
+    });
+    for (let el: any = walker.nextNode(); el; el = walker.nextNode()) {
+      const text = readText(el);
+      for (const bucket of amenityBuckets) {
+        if (el.matches(bucket.selector)) bucket.texts.push(text);
+      }
+    }
+    
+    // Broad list selectors also catch price and fee rows, which are never amenities
+    for (const bucket of amenityBuckets) {
+      for (const text of bucket.texts) {
+        if (text && text.length > 0 && text.length < 100 && !text.includes('$')) {
+          amenities.add(text);
         }
-        
-        // If no specific availability date found, look for text patterns
-        if (!availability) {
-          const allText = card.textContent || '';
-          const dateMatch = allText.match(/(\d{1,2}\/\d{1,2}\/\d{4})/);
-          if (dateMatch) {
-            availability = dateMatch[1];
-          }
+      }
+    }
+    
+    // Extract availability date
+    let availability = '';
+    for (const selector of availabilitySelectors) {
+      const availabilityEl = firstMatch.get(selector);
+      if (availabilityEl && availabilityEl.textContent?.trim()) {
+        const text = availabilityEl.textContent.trim();
+        // Check if text looks like a date (MM/DD/YYYY format)
+        if (text.match(/^\d{1,2}\/\d{1,2}\/\d{4}$/)) {
+          availability = text;
+          break;
         }
-        
-        return {
-          name: name || 'Unknown Plan',
-          price: price || 'Price not available',
-          bedBathCount: bedBathCount || 'Not specified',
-          squareFootage: squareFootage || 'Not specified',
-          amenities: [...new Set(amenities)], // Remove duplicates
-          availability: availability || 'Not specified'
-        };
-      }).filter((plan: any) => 
-        // Filter out cards that don't have essential data
-        plan.name !== 'Unknown Plan' && plan.name.length > 0
-      );
-    }, communityAmenities); // Pass communityAmenities to the page.evaluate function
-    
-    // Process the raw data into enhanced FloorPlan objects
-    const enhancedFloorPlans: FloorPlan[] = rawFloorPlans.map((rawPlan: any) => {
-      const price = DataProcessor.parsePrice(rawPlan.price);
-      const bedrooms = DataProcessor.parseBedrooms(rawPlan.bedBathCount);
-      const bathrooms = DataProcessor.parseBathrooms(rawPlan.bedBathCount);
-      const squareFootage = DataProcessor.parseSquareFootage(rawPlan.squareFootage);
-      const cleanName = DataProcessor.cleanFloorPlanName(rawPlan.name);
-      const unitType = DataProcessor.determineUnitType(rawPlan.name, bathrooms);
-      const pricePerSqFt = DataProcessor.calculatePricePerSqFt(price, squareFootage);
-      const availability = DataProcessor.standardizeAvailability(rawPlan.availability);
-      
-      return {
-        name: cleanName,
-        price: price,
-        bedrooms: bedrooms,
-        bathrooms: bathrooms,
-        squareFootage: squareFootage,
-        pricePerSqFt: pricePerSqFt,
-        amenities: rawPlan.amenities,
-        availability: availability,
-        propertyName: 'Camden Dunwoody',
-        propertyUrl: 'https://www.camdenliving.com/apartments/dunwoody-ga/camden-dunwoody/available-apartments',
-        unitType: unitType,
-        moveInDate: rawPlan.availability.match(/\d{1,2}\/\d{1,2}\/\d{4}/) ? rawPlan.availability : undefined
-      };
-    });
+      }
+    }
+    
+    // If no specific availability date found, look for text patterns
+    if (!availability) {
+      const allText = getCardText();
+      const dateMatch = allText.match(/(\d{1,2}\/\d{1,2}\/\d{4})/);
+      if (dateMatch) {
+        availability = dateMatch[1] ?? '';
+      }
+    }
+    
+    return {
+      name: name || 'Unknown Plan',
+      price: price || 'Price not available',
+      bedBathCount: bedBathCount || 'Not specified',
+      squareFootage: squareFootage || 'Not specified',
+      amenities: [...amenities],
+      availability: availability || 'Not specified'
+    };
+  }).filter((plan: any) => 
+    // Filter out cards that don't have essential data
+    plan.name !== 'Unknown Plan' && plan.name.length > 0
+  );
+  
+  return JSON.stringify(plans);
+}
+
+/**
+ * Load the listings page in its own scripted context, open the amenities
+ * section and read the community amenities listed there. Resolves with null
+ * when the section or its items can't be found, so that the empty result
+ * isn't cached
+ */
+async function fetchCommunityAmenities(browser: Browser): Promise<string[] | null> {
+  // The listings page may have been loaded with scripts disabled, where the
+  // amenities link can't open its section, so always use a scripted page here
+  const context = await browser.newContext({ ...SCRAPER_CONTEXT_OPTIONS, userAgent: CAMDEN_USER_AGENT });
+  try {
+    await blockUnneededRequests(context);
+    const page = await context.newPage();
+    await page.goto(CAMDEN_URL, { waitUntil: 'commit', timeout: 10000 });
     
-    return enhancedFloorPlans;
+    // The amenities navigation renders with the floor plan cards
+    await page.waitForSelector('.floorplan-card, [class*="floorplan-card"]', { timeout: 15000 });
+    const amenitiesLink = await page.$('#community-navigation-amenities-camden-dunwoody, a[href="#amenities"]');
+    if (!amenitiesLink) {
+      return null;
+    }
+    
+    console.log('📍 Found amenities navigation, clicking to load amenities section...');
+    await amenitiesLink.click();
+    
+    // Wait for amenity items to render rather than sleeping a fixed time
+    try {
+      await page.waitForSelector('#amenities li, [id*="amenities"] li', { timeout: 4000 });
+    } catch {
+      await page.waitForTimeout(500);
+    }
+    
+    // Extract community amenities
+    const amenities = await page.evaluate(readCommunityAmenitiesInPage);
+    
+    return amenities.length > 0 ? amenities : null;
+  } finally {
+    await context.close();
+  }
+}
+
+/**
+ * Community amenities are property-wide and rarely change, so reuse a cached
+ * copy when there is one and only visit the amenities section on a miss.
+ * Never rejects, so callers can start it early and await it later
+ */
+async function loadCommunityAmenities(browser: Browser): Promise<string[]> {
+  try {
+    const communityAmenities = await amenitiesCache.getOrSet(
+      COMMUNITY_AMENITIES_KEY,
+      COMMUNITY_AMENITIES_TTL_MS,
+      () => fetchCommunityAmenities(browser)
+    ) || [];
+    console.log(`🏢 Found ${communityAmenities.length} community amenities`);
+    return communityAmenities;
   } catch (error) {
-    console.error('❌ Error extracting Camden floor plans:', error);
+    console.log('⚠️ Could not navigate to amenities section, will extract from floor plan cards only');
     return [];
   }
 }
+
+async function extractCamdenFloorPlans(page: any, communityAmenities: Promise<string[]>): Promise<FloorPlan[]> {
+  // Read the cards while the community amenities load in their own page; the
+  // amenities click never touches this page, so its execution context is safe.
+  // The extractor is a module-level function, defined once rather than as a
+  // new closure per call
+  const cardsJson: string = await page.evaluate(extractCardsInPage);
+  const rawFloorPlans: RawCamdenFloorPlan[] = JSON.parse(cardsJson);
+  
+  // Community amenities are the same for every card, so de-duplicate them once
+  // and only filter each card's own (already unique) amenities against them
+  const communitySet = new Set(await communityAmenities);
+  const communityList = [...communitySet];
+  
+  // Process the raw data into enhanced FloorPlan objects
+  const enhancedFloorPlans: FloorPlan[] = rawFloorPlans.map(rawPlan => {
+    const price = DataProcessor.parsePrice(rawPlan.price);
+    const bedrooms = DataProcessor.parseBedrooms(rawPlan.bedBathCount);
+    const bathrooms = DataProcessor.parseBathrooms(rawPlan.bedBathCount);
+    const squareFootage = DataProcessor.parseSquareFootage(rawPlan.squareFootage);
+    const cleanName = DataProcessor.cleanFloorPlanName(rawPlan.name);
+    const unitType = DataProcessor.determineUnitType(rawPlan.name, bathrooms);
+    const availability = DataProcessor.standardizeAvailability(rawPlan.availability);
+    
+    return DataProcessor.createFloorPlan({
+      name: cleanName,
+      price: price,
+      bedrooms: bedrooms,
+      bathrooms: bathrooms,
+      squareFootage: squareFootage,
+      amenities: communityList.concat(rawPlan.amenities.filter(amenity => !communitySet.has(amenity))),
+      availability: availability,
+      propertyName: 'Camden Dunwoody',
+      propertyUrl: CAMDEN_URL,
+      unitType: unitType,
+      moveInDate: rawPlan.availability.match(/\d{1,2}\/\d{1,2}\/\d{4}/) ? rawPlan.availability : undefined
+    });
+  });
+  
+  return enhancedFloorPlans;
+}
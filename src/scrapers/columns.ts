@@ -3,28 +3,35 @@
  * Handles scraping apartment data from The Columns at Lake Ridge website
  */
 
-import { chromium } from 'playwright';
+import type { BrowserContext } from 'playwright';
 import { FloorPlan } from '../types/types';
 import { DataProcessor } from '../utils/dataProcessor';
+import { logger, LogLevel } from '../utils/logger';
+import { blockUnneededRequests, getBrowser, SCRAPER_CONTEXT_OPTIONS, waitForAnySelector } from './browser';
+
+// Patterns for parsing floor plan element text, built once at load
+const PRICE = /\$[\d,]+/;
+const BEDROOM_COUNT = /(\d+)\s*(bed|bedroom|br)/i;
+const BATHROOM_COUNT = /(\d+)\s*(bath|bathroom|ba)/i;
+const HALF_BATHROOM_COUNT = /(\d+\.5)\s*(baths?|bathrooms?|ba)/i;
+const SQUARE_FOOTAGE = /(\d+(?:,\d+)?)\s*(sq\.?\s*ft|sqft|square\s*feet)/i;
+const BED_DETAILS = /\d+\s*Bed/;
+const WHITESPACE_RUN = /\s+/g;
 
 export async function scrapeColumns(): Promise<FloorPlan[]> {
   console.log('🏢 Scraping The Columns at Lake Ridge...');
   
-  let browser;
+  let context: BrowserContext | undefined;
   
   try {
-    // Launch browser
-    console.log('🚀 Launching Columns browser...');
-    browser = await chromium.launch({
-      headless: true // Run in headless mode
-    });
-    
-    const page = await browser.newPage();
+    // Reuse the shared browser; this scraper only owns its context
+    console.log('🚀 Opening Columns browser context...');
+    const browser = await getBrowser();
     
     // Set user agent to avoid detection
-    await page.setExtraHTTPHeaders({
-      'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
-    });
+    context = await browser.newContext(SCRAPER_CONTEXT_OPTIONS);
+    await blockUnneededRequests(context);
+    const page = await context.newPage();
     
     console.log('📍 Navigating to The Columns at Lake Ridge website...');
     
@@ -34,9 +41,6 @@ export async function scrapeColumns(): Promise<FloorPlan[]> {
       timeout: 30000
     });
     
-    // Wait for page to be fully loaded
-    await page.waitForTimeout(5000);
-    
     // Get and log the page title
     const title = await page.title();
     console.log(`✅ Columns page loaded successfully! Title: "${title}"`);
@@ -57,28 +61,20 @@ export async function scrapeColumns(): Promise<FloorPlan[]> {
       
       const bathrooms = DataProcessor.parseBathrooms(rawText);
       // Use original name instead of overcleaning
-      const cleanName = plan.name.trim().replace(/\s+/g, ' ');
+      const cleanName = plan.name.trim().replace(WHITESPACE_RUN, ' ');
       
-      return {
+      return DataProcessor.createFloorPlan({
         name: cleanName,
         price: DataProcessor.parsePrice(rawPrice),
         bedrooms: DataProcessor.parseBedrooms(rawText),
         bathrooms: bathrooms,
         squareFootage: DataProcessor.parseSquareFootage(rawSqft),
-        pricePerSqFt: 0, // Will be calculated after processing
         amenities: plan.amenities || [],
         availability: plan.availability,
         propertyName: 'The Columns at Lake Ridge',
         propertyUrl: 'https://www.thecolumnsatlakeridge.com',
         unitType: DataProcessor.determineUnitType(cleanName, bathrooms)
-      };
-    }).map(plan => {
-      // Calculate price per square foot
-      const pricePerSqFt = plan.squareFootage > 0 ? Math.round((plan.price / plan.squareFootage) * 100) / 100 : 0;
-      return {
-        ...plan,
-        pricePerSqFt
-      };
+      });
     });
     
     // Log the extracted data
@@ -105,20 +101,23 @@ export async function scrapeColumns(): Promise<FloorPlan[]> {
     }
     return [];
   } finally {
-    if (browser) {
-      await browser.close();
-      console.log('🔒 Columns browser closed');
+    if (context) {
+      await context.close();
+      console.log('🔒 Columns browser context closed');
     }
   }
 }
 
+// Text of a matched floor plan element and of its first heading-like descendant
+interface ColumnsElementData {
+  text: string;
+  name: string | null;
+}
+
 async function extractColumnsFloorPlans(page: any): Promise<any[]> {
   try {
     console.log('🏠 Starting The Columns at Lake Ridge data extraction...');
     
-    // Wait for floor plan content to load
-    await page.waitForTimeout(3000);
-    
     // Look for common floor plan selectors
     const floorPlans: FloorPlan[] = [];
     
@@ -138,33 +137,57 @@ async function extractColumnsFloorPlans(page: any): Promise<any[]> {
       '[class*="unit"]'
     ];
     
-    let floorPlanElements = [];
-    let usedSelector = '';
+    // Wait for the app's data requests to settle and a plan container to attach,
+    // rather than sleeping for a fixed time
+    try {
+      await page.waitForLoadState('networkidle', { timeout: 15000 });
+    } catch {
+      console.log('⚠️ Network did not go idle, continuing with the current page');
+    }
+    try {
+      await waitForAnySelector(page, possibleSelectors, 5000);
+    } catch {
+      // No container attached; the probe below falls through to the debug output
+    }
     
-    for (const selector of possibleSelectors) {
-      const elements = await page.locator(selector).all();
-      if (elements.length > 0) {
-        console.log(`✅ Found ${elements.length} elements with selector: ${selector}`);
-        floorPlanElements = elements;
-        usedSelector = selector;
-        break;
+    // Find the first selector with matches and read the text and heading of its
+    // elements in a single round trip, rather than probing each selector from Node
+    const match: { selector: string; elements: ColumnsElementData[] } | null = await page.evaluate((selectors: string[]) => {
+      for (const selector of selectors) {
+        const matched = document.querySelectorAll(selector);
+        if (matched.length > 0) {
+          return {
+            selector,
+            elements: Array.from(matched, el => {
+              const nameEl = el.querySelector('h1, h2, h3, h4, .title, .name, [class*="title"], [class*="name"]');
+              return {
+                text: el.textContent || '',
+                name: nameEl ? nameEl.textContent : null
+              };
+            })
+          };
+        }
       }
-    }
+      return null;
+    }, possibleSelectors);
     
-    if (floorPlanElements.length === 0) {
+    if (!match) {
       console.log('🔍 No floor plan elements found with common selectors. Let\'s debug...');
       
       // Debug: Get all elements and their classes
       const allElements = await page.evaluate(() => {
-        const elements = Array.from(document.querySelectorAll('*'));
+        // Walk the live element collection directly instead of parsing a
+        // universal selector and copying a static NodeList into an array
+        const elements = document.getElementsByTagName('*');
         const classNames = new Set();
-        elements.forEach(el => {
-          if (el.className && typeof el.className === 'string') {
+        for (let i = 0, n = elements.length; i < n; i++) {
+          const el = elements[i];
+          if (el && el.className && typeof el.className === 'string') {
             el.className.split(' ').forEach(cls => {
               if (cls.trim()) classNames.add(cls.trim());
             });
           }
-        });
+        }
         return Array.from(classNames).sort();
       });
       
@@ -179,26 +202,26 @@ async function extractColumnsFloorPlans(page: any): Promise<any[]> {
       return [];
     }
     
-    console.log(`📊 Processing ${floorPlanElements.length} floor plan elements...`);
+    console.log(`✅ Found ${match.elements.length} elements with selector: ${match.selector}`);
+    console.log(`📊 Processing ${match.elements.length} floor plan elements...`);
+    
+    // Per-element traces are only printed at LEASEWATCH_LOG_LEVEL=DEBUG
+    const trace = logger.isEnabled(LogLevel.DEBUG);
     
     // Extract data from each floor plan element
-    for (let i = 0; i < floorPlanElements.length; i++) {
+    for (const [i, element] of match.elements.entries()) {
       try {
-        const element = floorPlanElements[i];
-        
-        // Extract text content from the element
-        const elementText = await element.textContent();
-        const elementHTML = await element.innerHTML();
-        
-        console.log(`\n🔍 Processing element ${i + 1}:`);
-        console.log(`Text: ${elementText?.substring(0, 200)}...`);
+        if (trace) {
+          console.log(`\n🔍 Processing element ${i + 1}:`);
+          console.log(`Text: ${element.text.substring(0, 200)}...`);
+        }
         
         // Try to extract floor plan information
-        const floorPlan = await extractFloorPlanFromElement(element, page);
+        const floorPlan = extractFloorPlanFromElement(element);
         
         if (floorPlan) {
           floorPlans.push(floorPlan);
-          console.log(`✅ Successfully extracted: ${floorPlan.name}`);
+          if (trace) console.log(`✅ Successfully extracted: ${floorPlan.name}`);
         }
         
       } catch (elementError) {
@@ -214,26 +237,22 @@ async function extractColumnsFloorPlans(page: any): Promise<any[]> {
   }
 }
 
-async function extractFloorPlanFromElement(element: any, page: any): Promise<any | null> {
+function extractFloorPlanFromElement(element: ColumnsElementData): any | null {
   try {
     // Get all text content from the element
-    const textContent = await element.textContent() || '';
+    const textContent = element.text;
     
     // Look for common patterns in apartment listings
-    const priceMatch = textContent.match(/\$[\d,]+/);
-    const bedroomMatch = textContent.match(/(\d+)\s*(bed|bedroom|br)/i);
-    const bathroomMatch = textContent.match(/(\d+)\s*(bath|bathroom|ba)/i);
-    const decimalBathMatch = textContent.match(/(\d+\.5)\s*(baths?|bathrooms?|ba)/i);
-    const sqftMatch = textContent.match(/(\d+(?:,\d+)?)\s*(sq\.?\s*ft|sqft|square\s*feet)/i);
+    const priceMatch = textContent.match(PRICE);
+    const bedroomMatch = textContent.match(BEDROOM_COUNT);
+    const bathroomMatch = textContent.match(BATHROOM_COUNT);
+    const decimalBathMatch = textContent.match(HALF_BATHROOM_COUNT);
+    const sqftMatch = textContent.match(SQUARE_FOOTAGE);
     
     // Try to find a name/title
     let name = 'Unknown Plan';
-    const nameElement = await element.locator('h1, h2, h3, h4, .title, .name, [class*="title"], [class*="name"]').first();
-    if (await nameElement.count() > 0) {
-      const nameText = await nameElement.textContent();
-      if (nameText && nameText.trim()) {
-        name = nameText.trim();
-      }
+    if (element.name && element.name.trim()) {
+      name = element.name.trim();
     }
     
     // If no specific name found, try to extract just the main title
@@ -245,7 +264,7 @@ async function extractFloorPlanFromElement(element: any, page: any): Promise<any
           const trimmedLine = line.trim();
           if (trimmedLine && (trimmedLine.includes('Bedroom') || trimmedLine.includes('Bath'))) {
             // Clean the name - just keep the main part before any numbers/details
-            name = trimmedLine.split(/\d+\s*Bed/)[0].trim() || trimmedLine;
+            name = (trimmedLine.split(BED_DETAILS)[0] ?? '').trim() || trimmedLine;
             if (name.length < 5) { // If name is too short, use original
               name = trimmedLine;
             }
@@ -263,9 +282,9 @@ async function extractFloorPlanFromElement(element: any, page: any): Promise<any
     // Fix bathroom parsing for .5 baths
     let bathCount = '?';
     if (decimalBathMatch) {
-      bathCount = decimalBathMatch[1];
+      bathCount = decimalBathMatch[1] ?? '?';
     } else if (bathroomMatch) {
-      bathCount = bathroomMatch[1];
+      bathCount = bathroomMatch[1] ?? '?';
     }
     
     // Return a temporary structure that will be processed later
@@ -3,28 +3,34 @@
  * Handles scraping apartment data from Drift Dunwoody website
  */
 
-import { chromium } from 'playwright';
+import type { BrowserContext } from 'playwright';
 import { FloorPlan } from '../types/types';
 import { DataProcessor } from '../utils/dataProcessor';
+import { logger, LogLevel } from '../utils/logger';
+import { blockUnneededRequests, getBrowser, SCRAPER_CONTEXT_OPTIONS, waitForAnySelector } from './browser';
+
+// Patterns for parsing the Cobblestone floor plan text, built once at load
+// Plan entries look like "A211$1,423" or "B1 - Prestige Renovation22$1,788"
+const FLOOR_PLAN_ENTRY = /[AB]\d+(?:\s*-\s*Prestige\s*Renovation)?\d*\$[\d,]+/gi;
+const PLAN_NAME = /^([AB]\d+(?:\s*-\s*Prestige\s*Renovation)?)/i;
+const PRICE = /\$[\d,]+/;
+const ALL_PRICES = /\$[\d,]+/g;
+const WHITESPACE_RUN = /\s+/g;
 
 export async function scrapeDrift(): Promise<FloorPlan[]> {
   console.log('🏢 Scraping Drift Dunwoody...');
   
-  let browser;
+  let context: BrowserContext | undefined;
   
   try {
-    // Launch browser
-    console.log('🚀 Launching Drift browser...');
-    browser = await chromium.launch({
-      headless: true // Run in headless mode
-    });
-    
-    const page = await browser.newPage();
+    // Reuse the shared browser; this scraper only owns its context
+    console.log('🚀 Opening Drift browser context...');
+    const browser = await getBrowser();
     
     // Set user agent to avoid detection
-    await page.setExtraHTTPHeaders({
-      'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
-    });
+    context = await browser.newContext(SCRAPER_CONTEXT_OPTIONS);
+    await blockUnneededRequests(context);
+    const page = await context.newPage();
     
     console.log('📍 Navigating to Drift Dunwoody Cobblestone app...');
     
@@ -34,9 +40,6 @@ export async function scrapeDrift(): Promise<FloorPlan[]> {
       timeout: 30000
     });
     
-    // Wait for page to be fully loaded
-    await page.waitForTimeout(5000);
-    
     // Get and log the page title
     const title = await page.title();
     console.log(`✅ Drift page loaded successfully! Title: "${title}"`);
@@ -47,40 +50,8 @@ export async function scrapeDrift(): Promise<FloorPlan[]> {
     
     // Extract floor plan data
     console.log('🔍 Extracting floor plan data...');
-    const floorPlans = await extractDriftFloorPlans(page);
-    
-    // Process and clean the data using DataProcessor
-    const processedFloorPlans = floorPlans.map(plan => {
-      // Extract raw text that was temporarily stored in old structure
-      const rawText = (plan as any).bedBathCount || '';
-      const rawPrice = (plan as any).price || '';
-      const rawSqft = (plan as any).squareFootage || '';
-      
-      const bathrooms = DataProcessor.parseBathrooms(rawText);
-      // Use original name and clean it
-      const cleanName = plan.name.trim().replace(/\s+/g, ' ');
-      
-      return {
-        name: cleanName,
-        price: DataProcessor.parsePrice(rawPrice),
-        bedrooms: DataProcessor.parseBedrooms(rawText),
-        bathrooms: bathrooms,
-        squareFootage: DataProcessor.parseSquareFootage(rawSqft),
-        pricePerSqFt: 0, // Will be calculated after processing
-        amenities: plan.amenities || [],
-        availability: plan.availability,
-        propertyName: 'Drift Dunwoody',
-        propertyUrl: 'https://www.driftdunwoody.com',
-        unitType: DataProcessor.determineUnitType(cleanName, bathrooms)
-      };
-    }).map(plan => {
-      // Calculate price per square foot
-      const pricePerSqFt = plan.squareFootage > 0 ? Math.round((plan.price / plan.squareFootage) * 100) / 100 : 0;
-      return {
-        ...plan,
-        pricePerSqFt
-      };
-    });
+    // Plans come back fully built, with no intermediate raw-text records to re-parse
+    const processedFloorPlans = await extractDriftFloorPlans(page);
     
     // Log the extracted data
     console.log(`📊 Found ${processedFloorPlans.length} floor plans:`);
@@ -106,22 +77,19 @@ export async function scrapeDrift(): Promise<FloorPlan[]> {
     }
     return [];
   } finally {
-    if (browser) {
-      await browser.close();
-      console.log('🔒 Drift browser closed');
+    if (context) {
+      await context.close();
+      console.log('🔒 Drift browser context closed');
     }
   }
 }
 
-async function extractDriftFloorPlans(page: any): Promise<any[]> {
+async function extractDriftFloorPlans(page: any): Promise<FloorPlan[]> {
   try {
     console.log('🏠 Starting Drift Dunwoody data extraction...');
     
-    // Wait for floor plan content to load
-    await page.waitForTimeout(3000);
-    
     // Look for common floor plan selectors
-    const floorPlans: any[] = [];
+    const floorPlans: FloorPlan[] = [];
     
     // Let's first explore what's on the page
     console.log('🔍 Analyzing page structure...');
@@ -144,33 +112,48 @@ async function extractDriftFloorPlans(page: any): Promise<any[]> {
       '[data-testid*="plan"]'
     ];
     
-    let floorPlanElements = [];
-    let usedSelector = '';
+    // Wait for the app's data requests to settle and a plan container to attach,
+    // rather than sleeping for a fixed time
+    try {
+      await page.waitForLoadState('networkidle', { timeout: 15000 });
+    } catch {
+      console.log('⚠️ Network did not go idle, continuing with the current page');
+    }
+    try {
+      await waitForAnySelector(page, possibleSelectors, 5000);
+    } catch {
+      // No container attached; the probe below falls through to the debug output
+    }
     
-    for (const selector of possibleSelectors) {
-      const elements = await page.locator(selector).all();
-      if (elements.length > 0) {
-        console.log(`✅ Found ${elements.length} elements with selector: ${selector}`);
-        floorPlanElements = elements;
-        usedSelector = selector;
-        break;
+    // Find the first selector with matches and read the text of its elements in a
+    // single round trip, rather than probing each selector from Node
+    const match: { selector: string; texts: string[] } | null = await page.evaluate((selectors: string[]) => {
+      for (const selector of selectors) {
+        const elements = document.querySelectorAll(selector);
+        if (elements.length > 0) {
+          return { selector, texts: Array.from(elements, el => el.textContent || '') };
+        }
       }
-    }
+      return null;
+    }, possibleSelectors);
     
-    if (floorPlanElements.length === 0) {
+    if (!match) {
       console.log('🔍 No floor plan elements found with common selectors. Let\'s debug...');
       
       // Debug: Get all elements and their classes
       const allElements = await page.evaluate(() => {
-        const elements = Array.from(document.querySelectorAll('*'));
+        // Walk the live element collection directly instead of parsing a
+        // universal selector and copying a static NodeList into an array
+        const elements = document.getElementsByTagName('*');
         const classNames = new Set();
-        elements.forEach(el => {
-          if (el.className && typeof el.className === 'string') {
+        for (let i = 0, n = elements.length; i < n; i++) {
+          const el = elements[i];
+          if (el && el.className && typeof el.className === 'string') {
             el.className.split(' ').forEach(cls => {
               if (cls.trim()) classNames.add(cls.trim());
             });
           }
-        });
+        }
         return Array.from(classNames).sort();
       });
       
@@ -191,7 +174,7 @@ async function extractDriftFloorPlans(page: any): Promise<any[]> {
         for (let i = 0; i < Math.min(priceElements.length, 10); i++) {
           try {
             const element = priceElements[i];
-            const extractedPlans = await extractFloorPlanFromElement(element, page);
+            const extractedPlans = extractFloorPlansFromText(await element.textContent() || '');
             if (extractedPlans && extractedPlans.length > 0) {
               floorPlans.push(...extractedPlans);
             }
@@ -204,25 +187,26 @@ async function extractDriftFloorPlans(page: any): Promise<any[]> {
       return floorPlans;
     }
     
-    console.log(`📊 Processing ${floorPlanElements.length} floor plan elements...`);
+    console.log(`✅ Found ${match.texts.length} elements with selector: ${match.selector}`);
+    console.log(`📊 Processing ${match.texts.length} floor plan elements...`);
+    
+    // Per-element traces are only printed at LEASEWATCH_LOG_LEVEL=DEBUG
+    const trace = logger.isEnabled(LogLevel.DEBUG);
     
     // Extract data from each floor plan element
-    for (let i = 0; i < floorPlanElements.length; i++) {
+    for (const [i, elementText] of match.texts.entries()) {
       try {
-        const element = floorPlanElements[i];
-        
-        // Extract text content from the element
-        const elementText = await element.textContent();
-        
-        console.log(`\n🔍 Processing element ${i + 1}:`);
-        console.log(`Text: ${elementText?.substring(0, 200)}...`);
+        if (trace) {
+          console.log(`\n🔍 Processing element ${i + 1}:`);
+          console.log(`Text: ${elementText.substring(0, 200)}...`);
+        }
         
         // Try to extract floor plan information
-        const extractedPlans = await extractFloorPlanFromElement(element, page);
+        const extractedPlans = extractFloorPlansFromText(elementText);
         
         if (extractedPlans && extractedPlans.length > 0) {
           floorPlans.push(...extractedPlans);
-          console.log(`✅ Successfully extracted ${extractedPlans.length} plans from element`);
+          if (trace) console.log(`✅ Successfully extracted ${extractedPlans.length} plans from element`);
         }
         
       } catch (elementError) {
@@ -238,20 +222,37 @@ async function extractDriftFloorPlans(page: any): Promise<any[]> {
   }
 }
 
-async function extractFloorPlanFromElement(element: any, page: any): Promise<any[]> {
+/**
+ * Build the final FloorPlan directly from values parsed out of the page text
+ */
+function createDriftFloorPlan(name: string, price: string, bedrooms: number, bathrooms: number, squareFootage: number): FloorPlan {
+  const cleanName = name.trim().replace(WHITESPACE_RUN, ' ');
+  return DataProcessor.createFloorPlan({
+    name: cleanName,
+    price: DataProcessor.parsePrice(price),
+    bedrooms,
+    bathrooms,
+    squareFootage,
+    amenities: [],
+    availability: 'Available',
+    propertyName: 'Drift Dunwoody',
+    propertyUrl: 'https://www.driftdunwoody.com',
+    unitType: DataProcessor.determineUnitType(cleanName, bathrooms)
+  });
+}
+
+function extractFloorPlansFromText(textContent: string): FloorPlan[] {
+  // Content previews and per-plan traces are only printed at LEASEWATCH_LOG_LEVEL=DEBUG
+  const trace = logger.isEnabled(LogLevel.DEBUG);
   try {
-    // Get all text content from the element
-    const textContent = await element.textContent() || '';
-    
-    console.log('🔍 Drift data content preview:', textContent.substring(0, 500));
+    if (trace) console.log('🔍 Drift data content preview:', textContent.substring(0, 500));
     
     // The Cobblestone app appears to have all floor plans in one element
     // Let's try to parse multiple floor plans from the text
-    const floorPlans: any[] = [];
+    const floorPlans: FloorPlan[] = [];
     
     // Look for patterns like "A211$1,423" or "B1 - Prestige Renovation22$1,788"
-    const floorPlanPattern = /(A\d+(?:\s*-\s*Prestige\s*Renovation)?\d*\d*\$[\d,]+|B\d+(?:\s*-\s*Prestige\s*Renovation)?\d*\d*\$[\d,]+)/gi;
-    const matches = textContent.match(floorPlanPattern);
+    const matches = textContent.match(FLOOR_PLAN_ENTRY);
     
     if (matches && matches.length > 0) {
       console.log(`🏠 Found ${matches.length} potential floor plan matches in Drift data`);
@@ -259,15 +260,15 @@ async function extractFloorPlanFromElement(element: any, page: any): Promise<any
       for (const match of matches) {
         try {
           // Extract plan name and price from each match
-          const nameMatch = match.match(/^([AB]\d+(?:\s*-\s*Prestige\s*Renovation)?)/i);
-          const priceMatch = match.match(/\$[\d,]+/);
+          const nameMatch = match.match(PLAN_NAME);
+          const priceMatch = match.match(PRICE);
           
           if (nameMatch && priceMatch) {
-            let planName = nameMatch[1].trim();
+            let planName = (nameMatch[1] ?? '').trim();
             const price = priceMatch[0];
             
             // Clean up the plan name
-            planName = planName.replace(/\s+/g, ' ');
+            planName = planName.replace(WHITESPACE_RUN, ' ');
             
             // Determine bedrooms and bathrooms based on plan name
             let bedrooms = 1; // Default
@@ -290,17 +291,8 @@ async function extractFloorPlanFromElement(element: any, page: any): Promise<any
               else if (planName.includes('B2')) sqft = 1200;
             }
             
-            const tempFloorPlan = {
-              name: planName,
-              price: price,
-              bedBathCount: `${bedrooms} Bed / ${bathrooms} Bath`,
-              squareFootage: sqft.toString(),
-              amenities: [],
-              availability: 'Available'
-            };
-            
-            floorPlans.push(tempFloorPlan);
-            console.log(`✅ Extracted Drift plan: ${planName} - ${price}`);
+            floorPlans.push(createDriftFloorPlan(planName, price, bedrooms, bathrooms, sqft));
+            if (trace) console.log(`✅ Extracted Drift plan: ${planName} - ${price}`);
           }
         } catch (parseError) {
           console.log(`❌ Error parsing floor plan match: ${match}`, parseError);
@@ -308,20 +300,12 @@ async function extractFloorPlanFromElement(element: any, page: any): Promise<any
       }
     } else {
       // Fallback: try to extract any price information
-      const priceMatches = textContent.match(/\$[\d,]+/g);
+      const priceMatches = textContent.match(ALL_PRICES);
       if (priceMatches && priceMatches.length > 0) {
         console.log(`💰 Found ${priceMatches.length} price patterns, creating basic floor plans`);
         
         priceMatches.forEach((price: string, index: number) => {
-          const tempFloorPlan = {
-            name: `Plan ${index + 1}`,
-            price: price,
-            bedBathCount: '? Bed / ? Bath',
-            squareFootage: '0',
-            amenities: [],
-            availability: 'Available'
-          };
-          floorPlans.push(tempFloorPlan);
+          floorPlans.push(createDriftFloorPlan(`Plan ${index + 1}`, price, 0, 0, 0));
         });
       }
     }
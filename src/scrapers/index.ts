@@ -0,0 +1,90 @@
+/**
+ * Scraper Registry
+ * Shared helpers for running the per-property scrapers
+ */
+
+import { FloorPlan, ScrapingResult } from '../types/types';
+
+export { scrapeCamden } from './camden';
+export { scrapeColumns } from './columns';
+export { scrapeDrift } from './drift';
+export { closeBrowser } from './browser';
+
+export type Scraper = () => Promise<FloorPlan[]>;
+
+const DEFAULT_SCRAPE_CONCURRENCY = 5;
+
+/**
+ * Read LEASEWATCH_SCRAPE_CONCURRENCY, which must be a positive integer.
+ * Anything else is reported and replaced by the default
+ */
+function readScrapeConcurrency(): number {
+  const raw = process.env.LEASEWATCH_SCRAPE_CONCURRENCY;
+  if (raw === undefined || raw.trim() === '') {
+    return DEFAULT_SCRAPE_CONCURRENCY;
+  }
+  
+  const value = /^\d+$/.test(raw.trim()) ? Number.parseInt(raw, 10) : NaN;
+  if (Number.isNaN(value) || value < 1) {
+    console.warn(`⚠️ Invalid LEASEWATCH_SCRAPE_CONCURRENCY "${raw}" (expected a positive integer), using ${DEFAULT_SCRAPE_CONCURRENCY}`);
+    return DEFAULT_SCRAPE_CONCURRENCY;
+  }
+  return value;
+}
+
+// Upper bound on scrapers holding a browser context at once
+const SCRAPE_CONCURRENCY = readScrapeConcurrency();
+
+let activeScrapes = 0;
+const waitingScrapes: Array<() => void> = [];
+
+async function acquireScrapeSlot(): Promise<void> {
+  if (activeScrapes < SCRAPE_CONCURRENCY) {
+    activeScrapes++;
+    return;
+  }
+  await new Promise<void>(resolve => waitingScrapes.push(resolve));
+}
+
+function releaseScrapeSlot(): void {
+  // Hand the slot straight to the next waiting scraper, if any
+  const next = waitingScrapes.shift();
+  if (next) {
+    next();
+  } else {
+    activeScrapes--;
+  }
+}
+
+/**
+ * Run a single property scraper and wrap the outcome in a ScrapingResult.
+ * Callers can start any number of these at once; at most SCRAPE_CONCURRENCY
+ * run at a time against the shared browser
+ */
+export async function scrapeProperty(scraper: Scraper, source: string, timestamp: string): Promise<ScrapingResult> {
+  await acquireScrapeSlot();
+  try {
+    const floorPlans = await scraper();
+    return {
+      success: true,
+      message: `${source} scraping completed successfully`,
+      timestamp,
+      source,
+      floorPlans,
+      errors: []
+    };
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : 'Unknown error';
+    console.error(`❌ ${source} scraping failed:`, error);
+    return {
+      success: false,
+      message: `${source} scraping failed: ${errorMessage}`,
+      timestamp,
+      source,
+      floorPlans: [],
+      errors: [errorMessage]
+    };
+  } finally {
+    releaseScrapeSlot();
+  }
+}
@@ -4,43 +4,102 @@
  */
 
 import * as http from 'http';
-import { main } from '../index';
+import { runPipeline } from './pipeline';
+import { closeBrowser } from './scrapers';
 
 const PORT = process.env.PORT || 1300;
 
+// Opt-in: POST /scrape calls within this many milliseconds of a completed scrape
+// reuse its response. Off (0) by default, so every POST runs a fresh scrape
+const scrapeCacheTtl = Number(process.env.SCRAPE_CACHE_TTL_MS ?? 0);
+const SCRAPE_CACHE_TTL_MS = Number.isNaN(scrapeCacheTtl) ? 0 : scrapeCacheTtl;
+
+// Static response bodies are serialized once at startup; /health only splices in its timestamp
+const NOT_FOUND_BODY = Buffer.from(JSON.stringify({ 
+  error: 'Not Found',
+  availableEndpoints: ['/health (GET)', '/scrape (POST)']
+}));
+const HEALTH_BODY_PREFIX = JSON.stringify({ 
+  status: 'healthy',
+  service: 'LeaseWatch',
+  timestamp: ''
+}).slice(0, -2);
+const HEALTH_BODY_SUFFIX = '"}';
+
+// The latest scrape response is held as encoded bytes so cache hits are written out as is
+let cachedScrape: { stamp: number; body: Buffer } | null = null;
+let scrapeInFlight: Promise<Buffer> | null = null;
+
+/**
+ * Run a scrape. Concurrent requests share the one in flight instead of each
+ * launching their own, and a completed result is only reused when
+ * SCRAPE_CACHE_TTL_MS is set
+ */
+async function runScrape(): Promise<Buffer> {
+  if (SCRAPE_CACHE_TTL_MS > 0 && cachedScrape && Date.now() - cachedScrape.stamp < SCRAPE_CACHE_TTL_MS) {
+    console.log('♻️  Serving cached scrape result');
+    return cachedScrape.body;
+  }
+  
+  if (!scrapeInFlight) {
+    scrapeInFlight = (async () => {
+      const startedAt = Date.now();
+      // HTTP clients only see the summary, so skip building the daily report
+      const result = await runPipeline({ includeReport: false });
+      const body = Buffer.from(JSON.stringify({ 
+        success: true, 
+        message: 'Scraping completed successfully',
+        timestamp: result.timestamp,
+        durationMs: Date.now() - startedAt,
+        totalFloorPlans: result.allFloorPlans.length,
+        sources: result.scrapingResults.map(r => ({
+          source: r.source,
+          success: r.success,
+          floorPlans: r.floorPlans.length,
+          errors: r.errors
+        }))
+      }));
+      cachedScrape = { stamp: Date.now(), body };
+      return body;
+    })().finally(() => {
+      scrapeInFlight = null;
+    });
+  }
+  
+  return scrapeInFlight;
+}
+
+/**
+ * Send a JSON response in a single write with an explicit Content-Length,
+ * accepting a payload object, an already-serialized string, or encoded bytes
+ */
+function sendJson(res: http.ServerResponse, status: number, payload: unknown): void {
+  const body = Buffer.isBuffer(payload)
+    ? payload
+    : Buffer.from(typeof payload === 'string' ? payload : JSON.stringify(payload));
+  res.writeHead(status, {
+    'Content-Type': 'application/json',
+    'Content-Length': body.length
+  });
+  res.end(body);
+}
+
 const server = http.createServer(async (req, res) => {
   if (req.url === '/scrape' && req.method === 'POST') {
     try {
       console.log('🌐 HTTP request received to start scraping...');
-      await main();
-      
-      res.writeHead(200, { 'Content-Type': 'application/json' });
-      res.end(JSON.stringify({ 
-        success: true, 
-        message: 'Scraping completed successfully',
-        timestamp: new Date().toISOString()
-      }));
+      sendJson(res, 200, await runScrape());
     } catch (error) {
-      res.writeHead(500, { 'Content-Type': 'application/json' });
-      res.end(JSON.stringify({ 
+      sendJson(res, 500, { 
         success: false, 
         message: error instanceof Error ? error.message : 'Unknown error',
         timestamp: new Date().toISOString()
-      }));
+      });
     }
   } else if (req.url === '/health' && req.method === 'GET') {
-    res.writeHead(200, { 'Content-Type': 'application/json' });
-    res.end(JSON.stringify({ 
-      status: 'healthy',
-      service: 'LeaseWatch',
-      timestamp: new Date().toISOString()
-    }));
+    sendJson(res, 200, HEALTH_BODY_PREFIX + new Date().toISOString() + HEALTH_BODY_SUFFIX);
   } else {
-    res.writeHead(404, { 'Content-Type': 'application/json' });
-    res.end(JSON.stringify({ 
-      error: 'Not Found',
-      availableEndpoints: ['/health (GET)', '/scrape (POST)']
-    }));
+    sendJson(res, 404, NOT_FOUND_BODY);
   }
 });
 
@@ -51,4 +110,16 @@ server.listen(PORT, () => {
   console.log(`  - POST http://localhost:${PORT}/scrape`);
 });
 
+// The listening socket and the shared scraper browser keep the process alive;
+// close both cleanly on shutdown signals
+function shutdown(signal: NodeJS.Signals): void {
+  console.log(`🛑 Received ${signal}, shutting down LeaseWatch server...`);
+  server.close(() => {
+    closeBrowser().finally(() => process.exit(0));
+  });
+}
+
+process.once('SIGTERM', shutdown);
+process.once('SIGINT', shutdown);
+
 export { server };
@@ -7,6 +7,9 @@ import * as fs from 'fs/promises';
 import * as path from 'path';
 import { DailyReport, ScrapingResult } from '../types/types';
 
+// Distinguishes temporary files written by this process within the same millisecond
+let tempFileCounter = 0;
+
 export class StorageService {
   private readonly dataDir: string;
   private readonly pricesFile: string;
@@ -24,12 +27,29 @@ export class StorageService {
     }
   }
 
+  /**
+   * Write a file by writing a temporary sibling and renaming it into place, so
+   * readers never see a partially written file and a crash leaves the old one intact.
+   * Each write uses its own temporary name, so overlapping saves to the same file
+   * never share one; the last rename wins
+   */
+  private async writeFileAtomic(filePath: string, data: string): Promise<void> {
+    const tempPath = `${filePath}.${process.pid}.${Date.now()}.${tempFileCounter++}.tmp`;
+    try {
+      await fs.writeFile(tempPath, data, 'utf8');
+      await fs.rename(tempPath, filePath);
+    } catch (error) {
+      await fs.unlink(tempPath).catch(() => undefined); // May not exist if the write itself failed
+      throw error;
+    }
+  }
+
   async saveDailyReport(report: DailyReport): Promise<void> {
     await this.ensureDataDirectory();
     
     try {
       const reportData = JSON.stringify(report, null, 2);
-      await fs.writeFile(this.pricesFile, reportData, 'utf8');
+      await this.writeFileAtomic(this.pricesFile, reportData);
       console.log(`💾 Daily report saved to ${this.pricesFile}`);
     } catch (error) {
       console.error('❌ Error saving daily report:', error);
@@ -59,7 +79,7 @@ export class StorageService {
     
     try {
       const resultData = JSON.stringify(result, null, 2);
-      await fs.writeFile(filepath, resultData, 'utf8');
+      await this.writeFileAtomic(filepath, resultData);
       console.log(`💾 Scraping result saved to ${filepath}`);
     } catch (error) {
       console.error('❌ Error saving scraping result:', error);
@@ -69,3 +69,11 @@ export interface ScraperConfig {
   retries: number;
   userAgent?: string;
 }
+
+export interface PipelineResult {
+  timestamp: string;
+  scrapingResults: ScrapingResult[];
+  allFloorPlans: FloorPlan[];
+  propertySummaries: PropertySummary[];
+  dailyReport: DailyReport | null; // null when skipped or no floor plans were found
+}
@@ -0,0 +1,61 @@
+/**
+ * File Cache
+ * Keeps slow-changing scraped metadata on disk so it can be reused across runs
+ */
+
+import * as fs from 'fs/promises';
+import * as path from 'path';
+
+interface CacheEntry<T> {
+  storedAt: number;
+  value: T;
+}
+
+export class FileCache {
+  private readonly cacheDir: string;
+
+  constructor(cacheDir: string = path.join(process.cwd(), '.cache')) {
+    this.cacheDir = cacheDir;
+  }
+
+  private entryPath(key: string): string {
+    return path.join(this.cacheDir, `${key.replace(/[^a-z0-9-]+/gi, '-')}.json`);
+  }
+
+  async get<T>(key: string, ttlMs: number): Promise<T | null> {
+    try {
+      const data = await fs.readFile(this.entryPath(key), 'utf8');
+      const entry = JSON.parse(data) as CacheEntry<T>;
+      return Date.now() - entry.storedAt < ttlMs ? entry.value : null;
+    } catch {
+      return null; // Missing or unreadable entries are treated as a miss
+    }
+  }
+
+  async set<T>(key: string, value: T): Promise<void> {
+    try {
+      await fs.mkdir(this.cacheDir, { recursive: true });
+      const entry: CacheEntry<T> = { storedAt: Date.now(), value };
+      await fs.writeFile(this.entryPath(key), JSON.stringify(entry), 'utf8');
+    } catch (error) {
+      console.error(`❌ Error writing cache entry ${key}:`, error);
+    }
+  }
+
+  /**
+   * Return the cached value for a key if it is younger than ttlMs, otherwise run
+   * the loader and cache its result. A null result is returned but not cached
+   */
+  async getOrSet<T>(key: string, ttlMs: number, loader: () => Promise<T | null>): Promise<T | null> {
+    const cached = await this.get<T>(key, ttlMs);
+    if (cached !== null) {
+      return cached;
+    }
+
+    const value = await loader();
+    if (value !== null) {
+      await this.set(key, value);
+    }
+    return value;
+  }
+}
@@ -5,6 +5,106 @@
 
 import { FloorPlan, PropertySummary, DailyReport } from '../types/types';
 
+// Patterns used by the parsers below, built once at load instead of per call
+const NON_PRICE_CHARS = /[^0-9,.]/g;
+const COMMAS = /,/g;
+const WHITESPACE_RUN = /\s+/g;
+const PRICE_NUMBER = /(\d+(?:,\d+)*(?:\.\d+)?)/;
+const SQFT_NUMBER = /(\d+(?:,\d+)*)/;
+const BEDROOM_COUNT = /(\d+)\s*(beds?|bedrooms?|br)/i;
+const HALF_BATHROOM_COUNT = /(\d+\.5)\s*(baths?|bathrooms?|ba)/i;
+const BATHROOM_COUNT = /(\d+)\s*(baths?|bathrooms?|ba)/i;
+const NAME_BED_BATH = /\d+\s*(bed|bedroom|bath|bathroom|br|ba)\s*/gi;
+const NAME_SQFT = /\d+,?\d*\s*sq\.?\s*ft\.?/gi;
+const NAME_FROM_PRICE = /from\s*\$[\d,]+/gi;
+const NAME_VIEW_APARTMENTS = /view\s*\d*\s*apartments?/gi;
+const AVAILABILITY_DATE = /(\d{1,2}\/\d{1,2}\/\d{4})/;
+
+// Parsed results for recently seen strings. Labels like "1 Bed / 1 Bath",
+// "$1,850+" and "Not specified" recur across cards, scrapers and server runs
+const PARSE_CACHE_LIMIT = 1024;
+const priceCache = new Map<string, number>();
+const squareFootageCache = new Map<string, number>();
+const bedroomCache = new Map<string, number>();
+const bathroomCache = new Map<string, number>();
+const availabilityCache = new Map<string, string>();
+
+function memoized<T>(cache: Map<string, T>, input: string, parse: (input: string) => T): T {
+  const hit = cache.get(input);
+  if (hit !== undefined) return hit;
+  
+  const value = parse(input);
+  if (cache.size >= PARSE_CACHE_LIMIT) cache.clear();
+  cache.set(input, value);
+  return value;
+}
+
+// Running totals for one property's summary, filled in a single pass over its plans
+interface PropertyStats {
+  totalFloorPlans: number;
+  minPrice: number;
+  maxPrice: number;
+  pricePerSqFtSum: number;
+  pricePerSqFtCount: number;
+  bedroomDistribution: PropertySummary['bedroomDistribution'];
+  availableUnits: number;
+}
+
+function createPropertyStats(): PropertyStats {
+  return {
+    totalFloorPlans: 0,
+    minPrice: Infinity,
+    maxPrice: -Infinity,
+    pricePerSqFtSum: 0,
+    pricePerSqFtCount: 0,
+    bedroomDistribution: { studio: 0, oneBed: 0, twoBed: 0, threeBed: 0, fourPlusBed: 0 },
+    availableUnits: 0
+  };
+}
+
+function addToPropertyStats(stats: PropertyStats, fp: FloorPlan): void {
+  stats.totalFloorPlans++;
+  
+  const price = fp.price;
+  if (price > 0) {
+    if (price < stats.minPrice) stats.minPrice = price;
+    if (price > stats.maxPrice) stats.maxPrice = price;
+  }
+  
+  const pricePerSqFt = fp.pricePerSqFt;
+  if (pricePerSqFt > 0) {
+    stats.pricePerSqFtSum += pricePerSqFt;
+    stats.pricePerSqFtCount++;
+  }
+  
+  const dist = stats.bedroomDistribution;
+  switch (fp.bedrooms) {
+    case 0: dist.studio++; break;
+    case 1: dist.oneBed++; break;
+    case 2: dist.twoBed++; break;
+    case 3: dist.threeBed++; break;
+    default: dist.fourPlusBed++; break;
+  }
+  
+  if (fp.availability.includes('Available') || fp.availability.includes('/')) {
+    stats.availableUnits++;
+  }
+}
+
+function toPropertySummary(propertyName: string, stats: PropertyStats): PropertySummary {
+  return {
+    propertyName,
+    totalFloorPlans: stats.totalFloorPlans,
+    priceRange: {
+      min: stats.minPrice,
+      max: stats.maxPrice
+    },
+    avgPricePerSqFt: Math.round((stats.pricePerSqFtSum / stats.pricePerSqFtCount) * 100) / 100,
+    bedroomDistribution: stats.bedroomDistribution,
+    availableUnits: stats.availableUnits
+  };
+}
+
 export class DataProcessor {
   
   /**
@@ -12,21 +112,24 @@ export class DataProcessor {
    */
   static parsePrice(priceString: string): number {
     if (!priceString) return 0;
-    
+    return memoized(priceCache, priceString, DataProcessor.parsePriceUncached);
+  }
+
+  private static parsePriceUncached(priceString: string): number {
     // Remove everything except digits, commas, and periods
-    const cleanPrice = priceString.replace(/[^0-9,.]/g, '');
+    const cleanPrice = priceString.replace(NON_PRICE_CHARS, '');
     
     // Handle ranges like "1,583 - 1,650"
     if (cleanPrice.includes('-')) {
       const parts = cleanPrice.split('-');
-      const prices = parts.map(p => parseFloat(p.replace(/,/g, '')));
+      const prices = parts.map(p => parseFloat(p.replace(COMMAS, '')));
       return Math.min(...prices.filter(p => !isNaN(p)));
     }
     
     // Handle "From $1,583" cases
-    const matches = cleanPrice.match(/(\d+(?:,\d+)*(?:\.\d+)?)/);
+    const matches = cleanPrice.match(PRICE_NUMBER);
     if (matches && matches[1]) {
-      return parseFloat(matches[1].replace(/,/g, ''));
+      return parseFloat(matches[1].replace(COMMAS, ''));
     }
     
     return 0;
@@ -37,10 +140,13 @@ export class DataProcessor {
    */
   static parseSquareFootage(sqftString: string): number {
     if (!sqftString) return 0;
-    
-    const matches = sqftString.match(/(\d+(?:,\d+)*)/);
+    return memoized(squareFootageCache, sqftString, DataProcessor.parseSquareFootageUncached);
+  }
+
+  private static parseSquareFootageUncached(sqftString: string): number {
+    const matches = sqftString.match(SQFT_NUMBER);
     if (matches && matches[1]) {
-      return parseInt(matches[1].replace(/,/g, ''));
+      return parseInt(matches[1].replace(COMMAS, ''));
     }
     
     return 0;
@@ -51,11 +157,14 @@ export class DataProcessor {
    */
   static parseBedrooms(bedroomString: string): number {
     if (!bedroomString) return 0;
-    
+    return memoized(bedroomCache, bedroomString, DataProcessor.parseBedroomsUncached);
+  }
+
+  private static parseBedroomsUncached(bedroomString: string): number {
     // Handle "Studio" cases
     if (bedroomString.toLowerCase().includes('studio')) return 0;
     
-    const matches = bedroomString.match(/(\d+)\s*(beds?|bedrooms?|br)/i);
+    const matches = bedroomString.match(BEDROOM_COUNT);
     if (matches && matches[1]) {
       return parseInt(matches[1]);
     }
@@ -68,15 +177,18 @@ export class DataProcessor {
    */
   static parseBathrooms(bathroomString: string): number {
     if (!bathroomString) return 0;
-    
+    return memoized(bathroomCache, bathroomString, DataProcessor.parseBathroomsUncached);
+  }
+
+  private static parseBathroomsUncached(bathroomString: string): number {
     // Look for decimal bathrooms first (e.g., "2.5")
-    const decimalMatch = bathroomString.match(/(\d+\.5)\s*(baths?|bathrooms?|ba)/i);
+    const decimalMatch = bathroomString.match(HALF_BATHROOM_COUNT);
     if (decimalMatch && decimalMatch[1]) {
       return parseFloat(decimalMatch[1]);
     }
     
     // Look for whole number bathrooms
-    const wholeMatch = bathroomString.match(/(\d+)\s*(baths?|bathrooms?|ba)/i);
+    const wholeMatch = bathroomString.match(BATHROOM_COUNT);
     if (wholeMatch && wholeMatch[1]) {
       return parseInt(wholeMatch[1]);
     }
@@ -91,13 +203,13 @@ export class DataProcessor {
     if (!name) return 'Unknown Plan';
     
     // Remove extra whitespace and newlines
-    let cleaned = name.replace(/\s+/g, ' ').trim();
+    let cleaned = name.replace(WHITESPACE_RUN, ' ').trim();
     
     // Remove redundant bedroom/bathroom info if it's already parsed separately
-    cleaned = cleaned.replace(/\d+\s*(bed|bedroom|bath|bathroom|br|ba)\s*/gi, '');
-    cleaned = cleaned.replace(/\d+,?\d*\s*sq\.?\s*ft\.?/gi, '');
-    cleaned = cleaned.replace(/from\s*\$[\d,]+/gi, '');
-    cleaned = cleaned.replace(/view\s*\d*\s*apartments?/gi, '');
+    cleaned = cleaned.replace(NAME_BED_BATH, '');
+    cleaned = cleaned.replace(NAME_SQFT, '');
+    cleaned = cleaned.replace(NAME_FROM_PRICE, '');
+    cleaned = cleaned.replace(NAME_VIEW_APARTMENTS, '');
     
     // Capitalize properly
     cleaned = cleaned.split(' ')
@@ -133,7 +245,10 @@ export class DataProcessor {
    */
   static standardizeAvailability(availability: string): string {
     if (!availability) return 'Contact for Availability';
-    
+    return memoized(availabilityCache, availability, DataProcessor.standardizeAvailabilityUncached);
+  }
+
+  private static standardizeAvailabilityUncached(availability: string): string {
     const lower = availability.toLowerCase();
     
     if (lower.includes('available now') || lower === 'available') {
@@ -145,7 +260,7 @@ export class DataProcessor {
     }
     
     // Try to parse dates
-    const dateMatch = availability.match(/(\d{1,2}\/\d{1,2}\/\d{4})/);
+    const dateMatch = availability.match(AVAILABILITY_DATE);
     if (dateMatch) {
       return `Available ${dateMatch[1]}`;
     }
@@ -154,65 +269,115 @@ export class DataProcessor {
   }
 
   /**
-   * Create property summary from floor plans
+   * Build a FloorPlan with every field assigned in a fixed order, so all plans
+   * share one object shape regardless of which scraper produced them.
+   * Price per sq ft is derived here rather than in a second pass.
    */
-  static createPropertySummary(propertyName: string, floorPlans: FloorPlan[]): PropertySummary {
-    const prices = floorPlans.map(fp => fp.price).filter(p => p > 0);
-    const pricesPerSqFt = floorPlans.map(fp => fp.pricePerSqFt).filter(p => p > 0);
-    
-    const bedroomCounts = floorPlans.reduce((acc, fp) => {
-      switch (fp.bedrooms) {
-        case 0: acc.studio++; break;
-        case 1: acc.oneBed++; break;
-        case 2: acc.twoBed++; break;
-        case 3: acc.threeBed++; break;
-        default: acc.fourPlusBed++; break;
-      }
-      return acc;
-    }, { studio: 0, oneBed: 0, twoBed: 0, threeBed: 0, fourPlusBed: 0 });
-
+  static createFloorPlan(fields: Omit<FloorPlan, 'pricePerSqFt'>): FloorPlan {
     return {
-      propertyName,
-      totalFloorPlans: floorPlans.length,
-      priceRange: {
-        min: Math.min(...prices),
-        max: Math.max(...prices)
-      },
-      avgPricePerSqFt: Math.round((pricesPerSqFt.reduce((a, b) => a + b, 0) / pricesPerSqFt.length) * 100) / 100,
-      bedroomDistribution: bedroomCounts,
-      availableUnits: floorPlans.filter(fp => 
-        fp.availability.includes('Available') || fp.availability.includes('/')
-      ).length
+      name: fields.name,
+      price: fields.price,
+      priceRange: fields.priceRange,
+      bedrooms: fields.bedrooms,
+      bathrooms: fields.bathrooms,
+      squareFootage: fields.squareFootage,
+      pricePerSqFt: DataProcessor.calculatePricePerSqFt(fields.price, fields.squareFootage),
+      amenities: fields.amenities,
+      availability: fields.availability,
+      moveInDate: fields.moveInDate,
+      propertyName: fields.propertyName,
+      propertyUrl: fields.propertyUrl,
+      description: fields.description,
+      unitType: fields.unitType
     };
   }
 
   /**
-   * Create comprehensive daily report
+   * Create property summary from floor plans
+   */
+  static createPropertySummary(propertyName: string, floorPlans: FloorPlan[]): PropertySummary {
+    const stats = createPropertyStats();
+    for (const fp of floorPlans) {
+      addToPropertyStats(stats, fp);
+    }
+    return toPropertySummary(propertyName, stats);
+  }
+
+  /**
+   * Create a summary for each named property in one pass over the floor plans,
+   * instead of filtering the plan list once per property. Summaries follow the
+   * order of propertyNames; properties without any plans are skipped
    */
-  static createDailyReport(propertySummaries: PropertySummary[], allFloorPlans: FloorPlan[]): DailyReport {
-    const prices = allFloorPlans.map(fp => fp.price).filter(p => p > 0);
-    const pricesPerSqFt = allFloorPlans.map(fp => fp.pricePerSqFt).filter(p => p > 0);
+  static createPropertySummaries(floorPlans: FloorPlan[], propertyNames: string[]): PropertySummary[] {
+    const statsByProperty = new Map<string, PropertyStats>();
+    for (const name of propertyNames) {
+      statsByProperty.set(name, createPropertyStats());
+    }
+    for (const fp of floorPlans) {
+      const stats = statsByProperty.get(fp.propertyName);
+      if (stats) {
+        addToPropertyStats(stats, fp);
+      }
+    }
     
-    const cheapest = allFloorPlans.reduce((min, fp) => 
-      fp.price > 0 && (min.price === 0 || fp.price < min.price) ? fp : min
-    );
+    const summaries: PropertySummary[] = [];
+    for (const [propertyName, stats] of statsByProperty) {
+      if (stats.totalFloorPlans > 0) {
+        summaries.push(toPropertySummary(propertyName, stats));
+      }
+    }
+    return summaries;
+  }
+
+  /**
+   * Create comprehensive daily report. Rent totals and the cheapest, most
+   * expensive and best-value units are all collected in a single pass.
+   * The report is dated from the given ISO timestamp, so a run can reuse the
+   * one it already took
+   */
+  static createDailyReport(propertySummaries: PropertySummary[], allFloorPlans: FloorPlan[], timestamp: string = new Date().toISOString()): DailyReport {
+    const first = allFloorPlans[0];
+    if (!first) {
+      throw new Error('Cannot create a daily report without floor plans');
+    }
     
-    const mostExpensive = allFloorPlans.reduce((max, fp) => 
-      fp.price > max.price ? fp : max
-    );
+    let priceSum = 0;
+    let priceCount = 0;
+    let pricePerSqFtSum = 0;
+    let pricePerSqFtCount = 0;
+    let cheapest = first;
+    let mostExpensive = first;
+    let bestValue = first;
     
-    const bestValue = allFloorPlans.reduce((best, fp) => 
-      fp.pricePerSqFt > 0 && (best.pricePerSqFt === 0 || fp.pricePerSqFt < best.pricePerSqFt) ? fp : best
-    );
+    for (let i = 0; i < allFloorPlans.length; i++) {
+      const fp = allFloorPlans[i] as FloorPlan;
+      const price = fp.price;
+      const pricePerSqFt = fp.pricePerSqFt;
+      
+      if (price > 0) {
+        priceSum += price;
+        priceCount++;
+      }
+      if (pricePerSqFt > 0) {
+        pricePerSqFtSum += pricePerSqFt;
+        pricePerSqFtCount++;
+      }
+      
+      // The first plan seeds each pick, so comparisons start from the second
+      if (i === 0) continue;
+      if (price > 0 && (cheapest.price === 0 || price < cheapest.price)) cheapest = fp;
+      if (price > mostExpensive.price) mostExpensive = fp;
+      if (pricePerSqFt > 0 && (bestValue.pricePerSqFt === 0 || pricePerSqFt < bestValue.pricePerSqFt)) bestValue = fp;
+    }
 
     return {
-      date: new Date().toISOString().split('T')[0] || new Date().toDateString(),
+      date: timestamp.slice(0, 10), // YYYY-MM-DD
       properties: propertySummaries,
       allFloorPlans,
       marketSummary: {
         totalUnits: allFloorPlans.length,
-        avgRent: Math.round(prices.reduce((a, b) => a + b, 0) / prices.length),
-        avgPricePerSqFt: Math.round((pricesPerSqFt.reduce((a, b) => a + b, 0) / pricesPerSqFt.length) * 100) / 100,
+        avgRent: Math.round(priceSum / priceCount),
+        avgPricePerSqFt: Math.round((pricePerSqFtSum / pricePerSqFtCount) * 100) / 100,
         cheapestUnit: cheapest,
         mostExpensiveUnit: mostExpensive,
         bestValueUnit: bestValue
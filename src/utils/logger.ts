@@ -55,10 +55,19 @@ export class Logger {
     }
   }
 
+  /**
+   * Whether messages at the given level are currently logged. Lets callers skip
+   * building trace output that would be filtered out
+   */
+  isEnabled(level: LogLevel): boolean {
+    return this.level >= level;
+  }
+
   setLevel(level: LogLevel): void {
     this.level = level;
   }
 }
 
-// Export a default logger instance
-export const logger = new Logger();
+// Export a default logger instance, at the level named by LEASEWATCH_LOG_LEVEL if set
+const envLevel = LogLevel[(process.env.LEASEWATCH_LOG_LEVEL || '').toUpperCase() as keyof typeof LogLevel];
+export const logger = new Logger(typeof envLevel === 'number' ? envLevel : LogLevel.INFO);
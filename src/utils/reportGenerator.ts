@@ -5,25 +5,30 @@
 
 import { FloorPlan, PropertySummary, DailyReport } from '../types/types';
 
+// Building an Intl formatter loads locale data, so create it once and reuse it for every value
+const CURRENCY_FORMAT = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+  minimumFractionDigits: 0,
+  maximumFractionDigits: 0
+});
+// Default-locale grouping, as Number.prototype.toLocaleString() would use
+const SQUARE_FOOTAGE_FORMAT = new Intl.NumberFormat();
+
 export class ReportGenerator {
   
   /**
    * Format currency values
    */
   static formatCurrency(amount: number): string {
-    return new Intl.NumberFormat('en-US', {
-      style: 'currency',
-      currency: 'USD',
-      minimumFractionDigits: 0,
-      maximumFractionDigits: 0
-    }).format(amount);
+    return CURRENCY_FORMAT.format(amount);
   }
 
   /**
    * Format square footage
    */
   static formatSquareFootage(sqft: number): string {
-    return `${sqft.toLocaleString()} sq ft`;
+    return `${SQUARE_FOOTAGE_FORMAT.format(sqft)} sq ft`;
   }
 
   /**
@@ -31,8 +36,7 @@ export class ReportGenerator {
    */
   static formatBedBath(bedrooms: number, bathrooms: number): string {
     const bedStr = bedrooms === 0 ? 'Studio' : `${bedrooms} Bed`;
-    const bathStr = bathrooms % 1 === 0 ? `${bathrooms} Bath` : `${bathrooms} Bath`;
-    return bedrooms === 0 ? `${bedStr} / ${bathStr}` : `${bedStr} / ${bathStr}`;
+    return `${bedStr} / ${bathrooms} Bath`;
   }
 
   /**
@@ -102,26 +106,27 @@ export class ReportGenerator {
       lines.push(this.generatePropertySummary(property));
     });
 
-    lines.push(`\n📋 DETAILED FLOOR PLANS`);
-    lines.push(`${'='.repeat(60)}`);
-
-    // Group floor plans by property
-    const floorPlansByProperty = report.allFloorPlans.reduce((acc, fp) => {
-      if (!acc[fp.propertyName]) acc[fp.propertyName] = [];
-      acc[fp.propertyName]!.push(fp);
-      return acc;
-    }, {} as Record<string, FloorPlan[]>);
+    lines.push(`\n📋 DETAILED FLOOR PLANS`, `${'='.repeat(60)}`);
+
+    // Group floor plans by property (one map lookup per plan)
+    const floorPlansByProperty = new Map<string, FloorPlan[]>();
+    for (const fp of report.allFloorPlans) {
+      const group = floorPlansByProperty.get(fp.propertyName);
+      if (group) {
+        group.push(fp);
+      } else {
+        floorPlansByProperty.set(fp.propertyName, [fp]);
+      }
+    }
 
-    Object.entries(floorPlansByProperty).forEach(([propertyName, floorPlans]) => {
-      lines.push(`\n🏢 ${propertyName.toUpperCase()}`);
-      lines.push(`${'-'.repeat(40)}`);
+    floorPlansByProperty.forEach((floorPlans, propertyName) => {
+      lines.push(`\n🏢 ${propertyName.toUpperCase()}`, `${'-'.repeat(40)}`);
       
       // Sort by price
       floorPlans.sort((a, b) => a.price - b.price);
       
       floorPlans.forEach(fp => {
-        lines.push(this.generateFloorPlanReport(fp));
-        lines.push(''); // Empty line between floor plans
+        lines.push(this.generateFloorPlanReport(fp), ''); // Empty line between floor plans
       });
     });
 